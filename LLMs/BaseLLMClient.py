@@ -1,29 +1,56 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict
+import asyncio
 import logging
 
 RoleMsg = Dict[str, str]
 
 class BaseLLMClient(ABC):
+    # Sampling temperature of the chat model; None when the client doesn't report it
+    temperature: Optional[float] = None
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
 
     @abstractmethod
-    def _invoke(self, messages: List[Any]) -> str:
-        """Низкоуровневый вызов модели."""
+    def _invoke(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> str:
+        """Низкоуровневый вызов модели; prompt_cache_key — ключ кэша префикса промпта у провайдера."""
         raise NotImplementedError
 
+    async def _ainvoke(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> str:
+        """Асинхронный вызов модели; по умолчанию синхронный вызов в отдельном потоке."""
+        return await asyncio.to_thread(self._invoke, messages, prompt_cache_key=prompt_cache_key)
+
+    def _stream(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> Iterator[str]:
+        """Потоковый вызов модели; по умолчанию весь ответ приходит одним фрагментом."""
+        yield self._invoke(messages, prompt_cache_key=prompt_cache_key)
+
     @abstractmethod
     def _embed(self, texts: List[str]) -> List[List[float]]:
         """Низкоуровневый вызов для получения эмбеддингов."""
         raise NotImplementedError
 
-    def chat_raw(self, messages: List[Any]) -> str:
+    def chat_raw(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> str:
         self.logger.info("invoke → %s | %d messages", self.__class__.__name__, len(messages))
-        response = self._invoke(messages)
+        response = self._invoke(messages, prompt_cache_key=prompt_cache_key)
         self.logger.info("response ← %s | %d chars", self.__class__.__name__, len(response or ""))
         return response
 
+    async def chat_raw_async(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> str:
+        self.logger.info("invoke async → %s | %d messages", self.__class__.__name__, len(messages))
+        response = await self._ainvoke(messages, prompt_cache_key=prompt_cache_key)
+        self.logger.info("response async ← %s | %d chars", self.__class__.__name__, len(response or ""))
+        return response
+
+    def chat_raw_stream(self, messages: List[Any], prompt_cache_key: Optional[str] = None) -> Iterator[str]:
+        """Ответ модели по фрагментам, по мере их поступления."""
+        self.logger.info("stream → %s | %d messages", self.__class__.__name__, len(messages))
+        total = 0
+        for chunk in self._stream(messages, prompt_cache_key=prompt_cache_key):
+            total += len(chunk)
+            yield chunk
+        self.logger.info("stream ← %s | %d chars", self.__class__.__name__, total)
+
     def chat_one(self, user_input: str, system_prompt: Optional[str] = None) -> str:
         """Удобный метод: одна строка пользователя (+ опционально system) → ответ модели."""
         msgs: List[RoleMsg] = []
@@ -29,6 +29,7 @@ class GigaChatClient(BaseLLMClient):
         super().__init__(logger)
         load_dotenv()
         credentials=os.getenv("GIGACHAT_CREDENTIALS")
+        self.temperature = temperature
         self.chat = GigaChat(
             credentials=credentials,
             scope=scope,
@@ -40,17 +41,28 @@ class GigaChatClient(BaseLLMClient):
         # Для эмбеддингов используем multilingual модель от sentence-transformers
         self.embedding_model = None  # Ленивая загрузка
 
-    def _invoke(self, messages: List[RoleMsg]) -> str:
+    def _to_lc_messages(self, messages: List[RoleMsg]) -> List[Any]:
         lc_msgs = []
         for m in messages:
             role = (m.get("role") or "user").lower()
             content = m.get("content") or ""
             constructor = ROLE_MAP.get(role, HumanMessage)
             lc_msgs.append(constructor(content=content))
+        return lc_msgs
 
-        resp = self.chat.invoke(lc_msgs)
+    # GigaChat has no prompt cache routing hint, so prompt_cache_key is accepted and ignored
+    def _invoke(self, messages: List[RoleMsg], prompt_cache_key: Optional[str] = None) -> str:
+        resp = self.chat.invoke(self._to_lc_messages(messages))
         return getattr(resp, "content", str(resp))
 
+    async def _ainvoke(self, messages: List[RoleMsg], prompt_cache_key: Optional[str] = None) -> str:
+        resp = await self.chat.ainvoke(self._to_lc_messages(messages))
+        return getattr(resp, "content", str(resp))
+
+    def _stream(self, messages: List[RoleMsg], prompt_cache_key: Optional[str] = None):
+        for chunk in self.chat.stream(self._to_lc_messages(messages)):
+            yield getattr(chunk, "content", str(chunk))
+
     def _load_embedding_model(self):
         """Ленивая загрузка модели эмбеддингов"""
         if self.embedding_model is None:
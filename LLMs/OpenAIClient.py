@@ -1,6 +1,7 @@
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from dotenv import load_dotenv
 from .BaseLLMClient import BaseLLMClient
+from typing import Optional
 import os
 
 class OpenAIClient(BaseLLMClient):
@@ -8,19 +9,42 @@ class OpenAIClient(BaseLLMClient):
         super().__init__()
         load_dotenv()
         api_key = os.getenv("OPENAI_API_KEY")
+        self.temperature = 1
 
         self.chat_client = ChatOpenAI(
             api_key=api_key,
             model=model_name,
-            temperature=1,
+            temperature=self.temperature,
         )
         self.embed_client = OpenAIEmbeddings(
             api_key=api_key,
             model=embed_model,
         )
 
-    def _invoke(self, prompt: str) -> str:
-        return self.chat_client.invoke(prompt).content
+    @staticmethod
+    def _request_kwargs(prompt_cache_key: Optional[str]) -> dict:
+        # prompt_cache_key routes requests with the same prompt prefix to the same cache
+        return {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else {}
+
+    def _log_cached_tokens(self, message) -> None:
+        usage = getattr(message, "usage_metadata", None) or {}
+        cached = (usage.get("input_token_details") or {}).get("cache_read")
+        if cached is not None:
+            self.logger.debug("prompt cache ← %d of %d input tokens cached", cached, usage.get("input_tokens", 0))
+
+    def _invoke(self, prompt: str, prompt_cache_key: Optional[str] = None) -> str:
+        message = self.chat_client.invoke(prompt, **self._request_kwargs(prompt_cache_key))
+        self._log_cached_tokens(message)
+        return message.content
+
+    async def _ainvoke(self, prompt: str, prompt_cache_key: Optional[str] = None) -> str:
+        message = await self.chat_client.ainvoke(prompt, **self._request_kwargs(prompt_cache_key))
+        self._log_cached_tokens(message)
+        return message.content
+
+    def _stream(self, prompt: str, prompt_cache_key: Optional[str] = None):
+        for chunk in self.chat_client.stream(prompt, **self._request_kwargs(prompt_cache_key)):
+            yield chunk.content
 
     def _embed(self, text: str) -> list[float]:
         return self.embed_client.embed_query(text)
@@ -4,16 +4,212 @@ Report Aggregator - Groups merged SAST report findings by rule_id.
 Creates aggregated view of vulnerabilities for better analysis.
 """
 
+import heapq
 import json
 import logging
+import mmap
+import os
+from sys import intern
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Any
-from collections import defaultdict
+from typing import Dict, List, Set, Optional, Any, Iterable, Iterator, Tuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Reports at least this large are memory-mapped instead of read into a bytes copy
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Longest first line checked for the header of an NDJSON merged report (report_merger streaming=True)
+NDJSON_HEADER_MAX_BYTES = 64 * 1024
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+SEVERITY_LEVELS = ("HIGH", "MEDIUM", "LOW")
+
+# Source tools as bit flags (kept in alphabetical order so decoding yields sorted names)
+SOURCE_BITS = {"bandit": 1, "semgrep": 2}
+
+
+class RuleAgg:
+    """Per-rule accumulator used while aggregating findings."""
+    __slots__ = ("rule_id", "rule_description", "message", "severity",
+                 "sources_mask", "evidence_locations")
+    
+    def __init__(self, rule_id: str, rule_description: str, message: str, severity: str):
+        self.rule_id = rule_id
+        self.rule_description = rule_description
+        self.message = message
+        self.severity = severity
+        self.sources_mask = 0
+        self.evidence_locations = set()
+    
+    @property
+    def sources(self) -> List[str]:
+        """Source tool names decoded from sources_mask, sorted."""
+        mask = self.sources_mask
+        return [name for name, bit in SOURCE_BITS.items() if mask & bit]
+    
+    @property
+    def count(self) -> int:
+        """Number of unique locations; each (rule_id, location) pair counts once."""
+        return len(self.evidence_locations)
+    
+    @property
+    def files(self) -> Set[str]:
+        """Affected files, derived from evidence_locations rather than tracked per finding."""
+        return {_file_from_location_key(location_key) for location_key in self.evidence_locations}
+    
+    def to_dict(self) -> Dict:
+        """Convert to the aggregated finding dict used in reports (sets become sorted lists)."""
+        return {
+            "rule_id": self.rule_id,
+            "rule_description": self.rule_description,
+            "message": self.message,
+            "severity": self.severity,
+            "sources": self.sources,
+            "count": self.count,
+            "files": sorted(self.files),
+            "evidence_locations": sorted(self.evidence_locations)
+        }
+
+
+class GroupAgg(RuleAgg):
+    """Semantic group accumulator; also tracks which CWEs were merged into it."""
+    __slots__ = ("grouped_cwes",)
+    
+    def __init__(self, rule_id: str, rule_description: str, message: str, severity: str):
+        super().__init__(rule_id, rule_description, message, severity)
+        # (cwe, count, original_description) tuples
+        self.grouped_cwes = []
+    
+    @property
+    def count(self) -> int:
+        """Sum of member rule counts (a location matched by two grouped CWEs counts twice)."""
+        return sum(map(itemgetter(1), self.grouped_cwes))
+    
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        # Sort grouped CWEs by count descending
+        data["grouped_cwes"] = [
+            {"cwe": cwe, "count": count, "original_description": description}
+            for cwe, count, description in sorted(self.grouped_cwes, key=itemgetter(1), reverse=True)
+        ]
+        return data
+
+
+FINDING_CATEGORIES = ("both", "semgrep", "bandit")
+
+
+def _file_from_location_key(location_key: str) -> str:
+    """Recover file_path from a merger location_key of the form "{file_path}:{start_line}-{end_line}"."""
+    return location_key.rpartition(":")[0]
+
+
+@lru_cache(maxsize=8)
+def _load_mappings(path: str, mtime: float) -> Tuple[Dict, Dict[str, str]]:
+    """
+    Parse a rule mappings file into (semantic_groupings, cwe_to_group).
+    
+    Cached per (path, mtime) so aggregators share one parsed copy until the file changes.
+    The returned dicts are shared between instances and must not be mutated.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    groupings = data.get("semantic_groupings", {})
+    cwe_to_group = {
+        cwe: group_id
+        for group_id, group_info in groupings.items()
+        for cwe in group_info.get("cwes", [])
+    }
+    return groupings, cwe_to_group
+
+
+def _iter_both_rows(category_findings: Iterable[Dict]) -> Iterator[Tuple[str, int, str, Dict]]:
+    """
+    Flatten "both" findings into (rule_id, source_bit, location_key, rule_data) rows.
+    
+    Each finding yields one row per tool, with rule_data pointing at the nested tool dict,
+    or a single row carrying both source bits when the tools agree on the rule_id.
+    """
+    semgrep_bit = SOURCE_BITS["semgrep"]
+    bandit_bit = SOURCE_BITS["bandit"]
+    both_bits = semgrep_bit | bandit_bit
+    for finding in category_findings:
+        location_key = intern(finding.get("location_key", ""))
+        semgrep_data = finding.get("semgrep", {})
+        bandit_data = finding.get("bandit", {})
+        semgrep_rule = intern(semgrep_data.get("rule_id", "unknown"))
+        bandit_rule = intern(bandit_data.get("rule_id", "unknown"))
+        
+        if semgrep_rule is bandit_rule:
+            yield semgrep_rule, both_bits, location_key, semgrep_data
+        else:
+            yield semgrep_rule, semgrep_bit, location_key, semgrep_data
+            yield bandit_rule, bandit_bit, location_key, bandit_data
+
+
+def _iter_single_rows(category_findings: Iterable[Dict], source_bit: int) -> Iterator[Tuple[str, int, str, Dict]]:
+    """Flatten single-tool ("semgrep" or "bandit") findings into rows."""
+    for finding in category_findings:
+        yield (
+            intern(finding.get("rule_id", "unknown")),
+            source_bit,
+            intern(finding.get("location_key", "")),
+            finding
+        )
+
+
+def _iter_category_rows(category: str, category_findings: Iterable[Dict]) -> Iterator[Tuple[str, int, str, Dict]]:
+    """Dispatch one findings category to its specialized row generator."""
+    if category == "both":
+        return _iter_both_rows(category_findings)
+    return _iter_single_rows(category_findings, SOURCE_BITS[category])
+
+
+def _iter_finding_rows(findings: Dict) -> Iterator[Tuple[str, int, str, Dict]]:
+    """Flatten all categories of an already loaded merged report into rows."""
+    for category in FINDING_CATEGORIES:
+        yield from _iter_category_rows(category, findings.get(category, []))
+
+
+def _read_ndjson_header(report_path: Path) -> Optional[Dict]:
+    """Header of a merged report written as NDJSON, or None for a regular JSON report."""
+    with open(report_path, 'rb') as f:
+        first_line = f.readline(NDJSON_HEADER_MAX_BYTES)
+    try:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        header = orjson.loads(first_line) if ORJSON_SUPPORT else json.loads(first_line)
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) and header.get("findings_ndjson") else None
+
+
+def _iter_ndjson_records(report_path: Path, category: Optional[str] = None) -> Iterator[Dict]:
+    """Finding records of an NDJSON merged report (optionally one category), skipping the header."""
+    loads = orjson.loads if ORJSON_SUPPORT else json.loads
+    with open(report_path, 'rb') as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                record = loads(line)
+                if category is None or record.get("category") == category:
+                    yield record
+
+
 class ReportAggregator:
     def __init__(self, merged_report_path: str, mappings_file: Optional[str] = None):
         self.report_path = Path(merged_report_path)
@@ -26,12 +222,11 @@ class ReportAggregator:
         self.semantic_groupings = self._load_semantic_groupings(mappings_file)
     
     def _load_semantic_groupings(self, mappings_file: Path) -> Dict:
-        """Load semantic groupings from external JSON file."""
+        """Load semantic groupings (and the CWE to group_id reverse mapping) from external JSON file."""
+        self._cwe_to_group = {}
         try:
-            with open(mappings_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            groupings = data.get("semantic_groupings", {})
+            mappings_file = Path(mappings_file)
+            groupings, self._cwe_to_group = _load_mappings(str(mappings_file), mappings_file.stat().st_mtime)
             logger.info(f"Loaded {len(groupings)} semantic groupings from {mappings_file}")
             return groupings
             
@@ -43,95 +238,120 @@ class ReportAggregator:
             return {}
         
     def load_merged_report(self) -> Dict:
-        """Load the merged SAST report."""
+        """Load the merged SAST report (via orjson, memory-mapping large files, when available)."""
+        # An NDJSON report (header line, then one finding per line) is regrouped into categories
+        header = _read_ndjson_header(self.report_path)
+        if header is not None:
+            findings = {category: [] for category in FINDING_CATEGORIES}
+            for record in _iter_ndjson_records(self.report_path):
+                findings.setdefault(record.get("category"), []).append(record)
+            return {"metadata": header.get("metadata", {}), "summary": header.get("summary", {}), "findings": findings}
+        
+        if ORJSON_SUPPORT:
+            with open(self.report_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+                    return orjson.loads(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        
         with open(self.report_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
-    def aggregate_by_rule_id(self, merged_report: Dict) -> Dict:
-        """Aggregate findings by rule_id."""
-        aggregated = defaultdict(lambda: {
-            "rule_id": "",
-            "rule_description": "",
-            "message": "",
-            "severity": "",
-            "sources": set(),
-            "count": 0,
-            "files": set(),
-            "evidence_locations": set()
-        })
-        
-        # Track unique (rule_id, location_key) combinations to avoid double counting
-        processed_combinations = set()
-        
-        findings = merged_report.get("findings", {})
-        
-        # Process all finding categories
-        for category in ["both", "semgrep", "bandit"]:
-            category_findings = findings.get(category, [])
+    def iter_finding_rows(self) -> Iterator[Tuple[str, int, str, Dict]]:
+        """
+        Yield finding rows straight from the merged report file.
+        
+        With ijson installed the findings arrays are stream-parsed one item at a time,
+        so the full report is never materialized; otherwise falls back to json.load.
+        NDJSON reports are always read line by line, one pass per category.
+        """
+        if _read_ndjson_header(self.report_path) is not None:
+            for category in FINDING_CATEGORIES:
+                yield from _iter_category_rows(category, _iter_ndjson_records(self.report_path, category))
+            return
+        
+        if not IJSON_SUPPORT:
+            yield from _iter_finding_rows(self.load_merged_report().get("findings", {}))
+            return
+        
+        with open(self.report_path, 'rb') as f:
+            for category in FINDING_CATEGORIES:
+                f.seek(0)
+                yield from _iter_category_rows(category, ijson.items(f, f"findings.{category}.item"))
+    
+    def aggregate_by_rule_id(self, merged_report: Dict) -> Dict[str, RuleAgg]:
+        """
+        Aggregate findings by rule_id.
+        
+        Values are RuleAgg records rather than plain dicts; call to_dict() on one
+        for the aggregated finding dict written to reports.
+        """
+        return self.aggregate_rows(_iter_finding_rows(merged_report.get("findings", {})))
+    
+    def aggregate_rows(self, rows: Iterable[Tuple[str, int, str, Dict]], use_semantic_groups: bool = False) -> Dict[str, RuleAgg]:
+        """
+        Aggregate flattened finding rows by rule_id.
+        
+        With use_semantic_groups, each rule's semantic group is resolved when the rule is first
+        seen, so the result (semantic groups followed by unmatched rules) is produced in the same pass.
+        """
+        aggregated = {}
+        # Bound locally to skip the attribute lookup on every row
+        aggregated_get = aggregated.get
+        
+        cwe_to_group = self._cwe_to_group if use_semantic_groups else {}
+        semantic_aggregated = {}
+        grouped_rules = []
+        
+        for rule_id, source_bit, location_key, rule_data in rows:
+            # Initialize rule if not seen before
+            agg = aggregated_get(rule_id)
+            if agg is None:
+                agg = aggregated[rule_id] = RuleAgg(
+                    rule_id,
+                    rule_data.get("rule_description", ""),
+                    rule_data.get("message", ""),
+                    intern(rule_data.get("severity", "LOW"))
+                )
+                
+                group_id = cwe_to_group.get(rule_id)
+                if group_id:
+                    group = semantic_aggregated.get(group_id)
+                    if group is None:
+                        group = semantic_aggregated[group_id] = self._new_group(group_id)
+                    grouped_rules.append((agg, group))
+            
+            agg.sources_mask |= source_bit
             
-            for finding in category_findings:
-                if category == "both":
-                    # For "both" category, we have nested semgrep and bandit data
-                    location_key = finding.get("location_key", "")
-                    file_path = finding.get("file_path", "")
-                    
-                    for tool in ["semgrep", "bandit"]:
-                        tool_data = finding.get(tool, {})
-                        rule_id = tool_data.get("rule_id", "unknown")
-                        
-                        # Create unique combination key
-                        combination_key = (rule_id, location_key)
-                        
-                        # Initialize rule if not seen before
-                        if rule_id not in aggregated:
-                            aggregated[rule_id]["rule_id"] = rule_id
-                            aggregated[rule_id]["rule_description"] = tool_data.get("rule_description", "")
-                            aggregated[rule_id]["message"] = tool_data.get("message", "")
-                            aggregated[rule_id]["severity"] = tool_data.get("severity", "LOW")
-                        
-                        aggregated[rule_id]["sources"].add(tool)
-                        
-                        # Only count each unique (rule_id, location) combination once
-                        if combination_key not in processed_combinations:
-                            aggregated[rule_id]["count"] += 1
-                            aggregated[rule_id]["files"].add(file_path)
-                            aggregated[rule_id]["evidence_locations"].add(location_key)
-                            processed_combinations.add(combination_key)
-                else:
-                    # For "semgrep" or "bandit" only categories
-                    rule_id = finding.get("rule_id", "unknown")
-                    location_key = finding.get("location_key", "")
-                    file_path = finding.get("file_path", "")
-                    
-                    # Create unique combination key
-                    combination_key = (rule_id, location_key)
-                    
-                    # Initialize rule if not seen before
-                    if rule_id not in aggregated:
-                        aggregated[rule_id]["rule_id"] = rule_id
-                        aggregated[rule_id]["rule_description"] = finding.get("rule_description", "")
-                        aggregated[rule_id]["message"] = finding.get("message", "")
-                        aggregated[rule_id]["severity"] = finding.get("severity", "LOW")
-                    
-                    aggregated[rule_id]["sources"].add(category)
-                    
-                    # Only count each unique (rule_id, location) combination once
-                    if combination_key not in processed_combinations:
-                        aggregated[rule_id]["count"] += 1
-                        aggregated[rule_id]["files"].add(file_path)
-                        aggregated[rule_id]["evidence_locations"].add(location_key)
-                        processed_combinations.add(combination_key)
-        
-        # Convert sets to sorted lists for JSON serialization
-        for rule_id in aggregated:
-            aggregated[rule_id]["sources"] = sorted(list(aggregated[rule_id]["sources"]))
-            aggregated[rule_id]["files"] = sorted(list(aggregated[rule_id]["files"]))
-            aggregated[rule_id]["evidence_locations"] = sorted(list(aggregated[rule_id]["evidence_locations"]))
-        
-        return dict(aggregated)
+            # Each unique (rule_id, location) combination counts once: count is len(evidence_locations)
+            agg.evidence_locations.add(location_key)
+        
+        if not use_semantic_groups:
+            return aggregated
+        
+        # Fold grouped rules into their groups and keep the rest individual
+        for agg, group in grouped_rules:
+            group.sources_mask |= agg.sources_mask
+            group.evidence_locations.update(agg.evidence_locations)
+            group.grouped_cwes.append((agg.rule_id, agg.count, agg.rule_description))
+            del aggregated[agg.rule_id]
+        
+        logger.info(f"Created {len(semantic_aggregated)} semantic groups, kept {len(aggregated)} individual rules")
+        
+        return semantic_aggregated | aggregated
     
-    def aggregate_by_semantic_groups(self, rule_aggregated_data: Dict) -> Dict:
-        """Aggregate rule-based data into semantic groups."""
+    def _new_group(self, group_id: str) -> GroupAgg:
+        """Create an empty accumulator for a semantic group."""
+        group_info = self.semantic_groupings[group_id]
+        return GroupAgg(
+            group_id,
+            group_info.get("display_name", ""),
+            group_info.get("description", ""),
+            group_info.get("severity", "MEDIUM")
+        )
+    
+    def aggregate_by_semantic_groups(self, rule_aggregated_data: Dict[str, RuleAgg]) -> Dict[str, RuleAgg]:
+        """Aggregate rule-based data into semantic groups (GroupAgg records, plus unmatched RuleAgg ones)."""
         if not self.semantic_groupings:
             print("No semantic groupings available. Returning rule-based aggregation.")
             return rule_aggregated_data
@@ -139,11 +359,7 @@ class ReportAggregator:
         semantic_aggregated = {}
         unmatched_rules = {}
         
-        # Create a reverse mapping from CWE to group_id
-        cwe_to_group = {}
-        for group_id, group_info in self.semantic_groupings.items():
-            for cwe in group_info.get("cwes", []):
-                cwe_to_group[cwe] = group_id
+        cwe_to_group = self._cwe_to_group
         
         # Process each rule and assign to semantic group or keep individual
         for rule_id, rule_data in rule_aggregated_data.items():
@@ -151,86 +367,57 @@ class ReportAggregator:
             
             if group_id:
                 # This rule belongs to a semantic group
-                if group_id not in semantic_aggregated:
-                    group_info = self.semantic_groupings[group_id]
-                    semantic_aggregated[group_id] = {
-                        "rule_id": group_id,
-                        "rule_description": group_info.get("display_name", ""),
-                        "message": group_info.get("description", ""),
-                        "severity": group_info.get("severity", "MEDIUM"),
-                        "sources": set(),
-                        "count": 0,
-                        "files": set(),
-                        "evidence_locations": set(),
-                        "grouped_cwes": []
-                    }
+                group = semantic_aggregated.get(group_id)
+                if group is None:
+                    group = semantic_aggregated[group_id] = self._new_group(group_id)
                 
                 # Merge this rule into the semantic group
-                semantic_aggregated[group_id]["sources"].update(rule_data["sources"])
-                semantic_aggregated[group_id]["count"] += rule_data["count"]
-                semantic_aggregated[group_id]["files"].update(rule_data["files"])
-                semantic_aggregated[group_id]["evidence_locations"].update(rule_data["evidence_locations"])
+                group.sources_mask |= rule_data.sources_mask
+                group.evidence_locations.update(rule_data.evidence_locations)
                 
                 # Track which CWEs were grouped
-                semantic_aggregated[group_id]["grouped_cwes"].append({
-                    "cwe": rule_id,
-                    "count": rule_data["count"],
-                    "original_description": rule_data["rule_description"]
-                })
+                group.grouped_cwes.append((rule_id, rule_data.count, rule_data.rule_description))
                 
             else:
                 # This rule doesn't belong to any semantic group - keep it individual
                 unmatched_rules[rule_id] = rule_data
         
-        # Convert sets to sorted lists for JSON serialization
-        for group_id in semantic_aggregated:
-            semantic_aggregated[group_id]["sources"] = sorted(list(semantic_aggregated[group_id]["sources"]))
-            semantic_aggregated[group_id]["files"] = sorted(list(semantic_aggregated[group_id]["files"]))
-            semantic_aggregated[group_id]["evidence_locations"] = sorted(list(semantic_aggregated[group_id]["evidence_locations"]))
-            # Sort grouped CWEs by count descending
-            semantic_aggregated[group_id]["grouped_cwes"] = sorted(
-                semantic_aggregated[group_id]["grouped_cwes"], 
-                key=lambda x: x["count"], 
-                reverse=True
-            )
-        
-        # Combine semantic groups and unmatched individual rules
-        final_aggregated = {}
-        final_aggregated.update(semantic_aggregated)
-        final_aggregated.update(unmatched_rules)
-        
         logger.info(f"Created {len(semantic_aggregated)} semantic groups, kept {len(unmatched_rules)} individual rules")
         
-        return final_aggregated
+        # Combine semantic groups and unmatched individual rules in a single copy
+        return semantic_aggregated | unmatched_rules
     
-    def generate_summary_stats(self, aggregated_data: Dict) -> Dict:
+    def generate_summary_stats(self, aggregated_data: Dict[str, RuleAgg]) -> Dict:
         """Generate summary statistics for aggregated data."""
         total_rules = len(aggregated_data)
-        total_findings = sum(rule_data["count"] for rule_data in aggregated_data.values())
-        
-        # Count by severity
-        severity_counts = defaultdict(int)
-        for rule_data in aggregated_data.values():
-            severity_counts[rule_data["severity"]] += rule_data["count"]
+        total_findings = 0
         
-        # Count by source tools
-        source_counts = defaultdict(int)
+        # Count by severity and source tools in a single pass; known keys are pre-seeded
+        severity_counts = dict.fromkeys(SEVERITY_LEVELS, 0)
+        source_counts = dict.fromkeys(SOURCE_BITS, 0)
+        source_bits = tuple(SOURCE_BITS.items())
         for rule_data in aggregated_data.values():
-            for source in rule_data["sources"]:
-                source_counts[source] += rule_data["count"]
+            count = rule_data.count
+            total_findings += count
+            severity_counts[rule_data.severity] = severity_counts.get(rule_data.severity, 0) + count
+            mask = rule_data.sources_mask
+            for source, bit in source_bits:
+                if mask & bit:
+                    source_counts[source] += count
         
         # Top vulnerabilities by count
-        top_vulnerabilities = sorted(
-            [(rule_id, data["count"], data["severity"]) for rule_id, data in aggregated_data.items()],
-            key=lambda x: x[1], 
-            reverse=True
-        )[:10]
+        top_vulnerabilities = heapq.nlargest(
+            10,
+            ((rule_id, data.count, data.severity) for rule_id, data in aggregated_data.items()),
+            key=itemgetter(1)
+        )
         
         return {
             "total_unique_rules": total_rules,
             "total_findings": total_findings,
-            "severity_distribution": dict(severity_counts),
-            "source_distribution": dict(source_counts),
+            # Pre-seeded levels without findings are left out, as before
+            "severity_distribution": {severity: count for severity, count in severity_counts.items() if count},
+            "source_distribution": {source: count for source, count in source_counts.items() if count},
             "top_10_vulnerabilities": [
                 {
                     "rule_id": rule_id,
@@ -243,21 +430,19 @@ class ReportAggregator:
     def aggregate_report(self, output_file: str = "aggregated_sast_report.json", use_semantic_groups: bool = True) -> Dict:
         """Main method to aggregate the merged report."""
         
-        logger.info(f"Loading merged report: {self.report_path}")
-        merged_report = self.load_merged_report()
+        logger.info(f"Reading merged report: {self.report_path} (streaming: {IJSON_SUPPORT})")
         
-        logger.info("Aggregating findings by rule_id...")
-        rule_aggregated_data = self.aggregate_by_rule_id(merged_report)
-        
-        # Apply semantic grouping if enabled
-        if use_semantic_groups and self.semantic_groupings:
-            logger.info("Applying semantic grouping...")
-            aggregated_data = self.aggregate_by_semantic_groups(rule_aggregated_data)
+        # Apply semantic grouping if enabled, in the same pass as rule aggregation
+        use_semantic_groups = bool(use_semantic_groups and self.semantic_groupings)
+        if use_semantic_groups:
+            logger.info("Aggregating findings by rule_id with semantic grouping...")
             aggregation_type = "by_semantic_groups"
         else:
-            aggregated_data = rule_aggregated_data
+            logger.info("Aggregating findings by rule_id...")
             aggregation_type = "by_rule_id"
         
+        aggregated_data = self.aggregate_rows(self.iter_finding_rows(), use_semantic_groups)
+        
         logger.info("Generating summary statistics...")
         summary_stats = self.generate_summary_stats(aggregated_data)
         
@@ -266,15 +451,25 @@ class ReportAggregator:
             "metadata": {
                 "source_report": str(self.report_path),
                 "generated_at": "2025-08-24T00:00:00Z",
-                "aggregation_type": aggregation_type
+                "aggregation_type": aggregation_type,
+                # Reports from before this marker keep aggregated_findings as a dict keyed by rule_id
+                "findings_format": "list"
             },
             "summary": summary_stats,
-            "aggregated_findings": aggregated_data
+            # Ranked by count so consumers get the most frequent findings first
+            "aggregated_findings": [
+                rule_data.to_dict()
+                for rule_data in sorted(aggregated_data.values(), key=attrgetter("count"), reverse=True)
+            ]
         }
         
         # Save aggregated report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(aggregated_report, f, indent=2, ensure_ascii=False)
+        if ORJSON_SUPPORT:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(aggregated_report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(aggregated_report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Aggregated report saved to: {output_file}")
         logger.info(f"Summary:")
@@ -6,13 +6,165 @@ Categorizes findings as "both", "semgrep", or "bandit" based on location matchin
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple, Optional, Any, Iterable, Iterator
+
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Errors that mean a SARIF file could not be read or parsed
+SARIF_LOAD_ERRORS = (json.JSONDecodeError, IOError) + ((ijson.JSONError,) if IJSON_SUPPORT else ())
+
+# SARIF levels and tool severities (lowercased) to LOW/MEDIUM/HIGH; anything else is LOW
+_SEVERITY_MAP = {
+    "error": "HIGH", "high": "HIGH",
+    "warning": "MEDIUM", "medium": "MEDIUM",
+    "note": "LOW", "info": "LOW", "low": "LOW"
+}
+
+# Merged report finding categories, in report order
+FINDING_CATEGORIES = ("both", "semgrep", "bandit")
+
+# Spare bytes after the NDJSON header line, so the summary can be patched in once all findings are written
+NDJSON_HEADER_RESERVE = 512
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+class Finding:
+    """Normalized finding extracted from a single SARIF result."""
+    __slots__ = ("tool", "rule_id", "rule_description", "original_rule_id", "message",
+                 "file_path", "start_line", "end_line", "severity", "snippet", "location_id", "location_key")
+    
+    def __init__(self, tool: str, rule_id: str, rule_description: str, original_rule_id: str, message: str,
+                 file_path: str, start_line: int, end_line: int, severity: str, snippet: str,
+                 location_id: int, location_key: str):
+        self.tool = tool
+        self.rule_id = rule_id
+        self.rule_description = rule_description
+        self.original_rule_id = original_rule_id
+        self.message = message
+        self.file_path = file_path
+        self.start_line = start_line
+        self.end_line = end_line
+        self.severity = severity
+        self.snippet = snippet
+        self.location_id = location_id
+        self.location_key = location_key
+    
+    def rule_fields(self) -> Dict:
+        """Rule-level fields as written to the merged report."""
+        return {
+            "rule_id": self.rule_id,
+            "rule_description": self.rule_description,
+            "message": self.message,
+            "severity": self.severity,
+            "snippet": self.snippet
+        }
+    
+    def to_dict(self) -> Dict:
+        """Convert to the single-tool entry used in the merged report (category is the tool)."""
+        return {
+            "category": self.tool,
+            "location_key": self.location_key,
+            "file_path": self.file_path,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            **self.rule_fields()
+        }
+
+
+class MatchedFinding:
+    """Semgrep and bandit findings reported at the same location."""
+    __slots__ = ("semgrep", "bandit")
+    
+    def __init__(self, semgrep: Finding, bandit: Finding):
+        self.semgrep = semgrep
+        self.bandit = bandit
+    
+    def to_dict(self) -> Dict:
+        """Convert to the "both" entry used in the merged report."""
+        semgrep = self.semgrep
+        return {
+            "category": "both",
+            "location_key": semgrep.location_key,
+            "file_path": semgrep.file_path,
+            "start_line": semgrep.start_line,
+            "end_line": semgrep.end_line,
+            "snippet": semgrep.snippet or self.bandit.snippet,
+            "semgrep": semgrep.rule_fields(),
+            "bandit": self.bandit.rule_fields()
+        }
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode one compact JSON line (NDJSON record) as UTF-8 bytes."""
+    if ORJSON_SUPPORT:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def iter_ndjson_report(report_path: str) -> Iterator[Dict]:
+    """
+    Read a merged report written with streaming=True one line at a time.
+    
+    Yields the header ({"metadata", "summary", "findings_ndjson"}) first, then each
+    finding record (its "category" says which bucket it belongs to). Findings are listed
+    in matching order, so categories are interleaved.
+    """
+    loads = orjson.loads if ORJSON_SUPPORT else json.loads
+    with open(report_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+@lru_cache(maxsize=8)
+def _load_mappings(path: str, mtime_ns: int) -> Tuple[Dict[str, str], Dict, Dict[str, str], Dict[str, str]]:
+    """
+    Parse a rule mappings file into (rule_to_cwe, cwe_severity_mappings, cwe_descriptions, cwe_to_severity).
+    
+    Cached per (path, mtime_ns) so mergers share one parsed copy until the file changes.
+    The returned dicts are shared between instances and must not be mutated.
+    """
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handling is unchanged
+    if ORJSON_SUPPORT:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    
+    # Combine semgrep and bandit rules into one mapping
+    rule_to_cwe = {}
+    rule_to_cwe.update(data.get("rule_to_cwe", {}).get("semgrep_rules", {}))
+    rule_to_cwe.update(data.get("rule_to_cwe", {}).get("bandit_rules", {}))
+    
+    cwe_severity_mappings = data.get("cwe_severity_mapping", {})
+    
+    # Reverse index so per-finding severity lookup is a single dict hit;
+    # setdefault keeps the first bucket a CWE appears in, like the old scan
+    cwe_to_severity = {}
+    for severity_level, cwe_list in cwe_severity_mappings.items():
+        for cwe in cwe_list:
+            cwe_to_severity.setdefault(cwe, severity_level)
+    
+    return rule_to_cwe, cwe_severity_mappings, data.get("cwe_descriptions", {}), cwe_to_severity
+
+
 class SARIFReportMerger:
     def __init__(self, semgrep_sarif_path: Optional[str] = None, bandit_sarif_path: Optional[str] = None, mappings_file: Optional[str] = None):
         # Check that at least one report path is provided
@@ -56,21 +208,20 @@ class SARIFReportMerger:
             mappings_file = Path(__file__).parent / "rule_mappings.json"
         
         self.rule_to_cwe = self._load_rule_mappings(mappings_file)
+        
+        # Locations are interned to small ints so matching hashes ints instead of strings;
+        # _location_keys maps an id back to its "path:start-end" key for the report
+        self._location_ids: Dict[Tuple[str, int, int], int] = {}
+        self._location_keys: List[str] = []
+        self._location_lock = threading.Lock()
     
     def _load_rule_mappings(self, mappings_file: Path) -> Dict[str, str]:
         """Load rule to CWE mappings from external JSON file."""
         try:
-            with open(mappings_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Combine semgrep and bandit rules into one mapping
-            mappings = {}
-            mappings.update(data.get("rule_to_cwe", {}).get("semgrep_rules", {}))
-            mappings.update(data.get("rule_to_cwe", {}).get("bandit_rules", {}))
-            
-            # Store CWE severity mappings and descriptions
-            self.cwe_severity_mappings = data.get("cwe_severity_mapping", {})
-            self.cwe_descriptions = data.get("cwe_descriptions", {})
+            mappings_file = Path(mappings_file)
+            mappings, self.cwe_severity_mappings, self.cwe_descriptions, self.cwe_to_severity = _load_mappings(
+                str(mappings_file), mappings_file.stat().st_mtime_ns
+            )
             
             logger.info(f"Loaded {len(mappings)} rule mappings from {mappings_file}")
             return mappings
@@ -78,11 +229,13 @@ class SARIFReportMerger:
         except FileNotFoundError:
             logger.warning(f"Mappings file {mappings_file} not found. Using empty mappings.")
             self.cwe_severity_mappings = {}
+            self.cwe_to_severity = {}
             self.cwe_descriptions = {}
             return {}
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in {mappings_file}: {e}. Using empty mappings.")
             self.cwe_severity_mappings = {}
+            self.cwe_to_severity = {}
             self.cwe_descriptions = {}
             return {}
         
@@ -98,49 +251,91 @@ class SARIFReportMerger:
             logger.error(f"Failed to load SARIF file {sarif_path}: {e}")
             return None
     
-    def extract_findings(self, sarif_data: Dict, tool_name: str) -> List[Dict]:
+    def extract_findings(self, sarif_data: Dict, tool_name: str) -> List[Finding]:
         """Extract findings from SARIF data with normalized structure."""
-        findings = []
-        
-        for run in sarif_data.get("runs", []):
-            for result in run.get("results", []):
-                # Extract location info
-                locations = result.get("locations", [])
-                if not locations:
-                    continue
-                    
-                location = locations[0].get("physicalLocation", {})
-                artifact = location.get("artifactLocation", {})
-                region = location.get("region", {})
-                
-                file_path = self._normalize_file_path(artifact.get("uri", ""))
-                start_line = region.get("startLine", 0)
-                end_line = region.get("endLine", start_line)
-                
-                # Extract code snippet
-                snippet = self._extract_snippet(location)
-                
-                # Create normalized finding
-                original_rule_id = result.get("ruleId", "unknown")
-                cwe_id = self._convert_to_cwe(original_rule_id)
-                finding = {
-                    "tool": tool_name,
-                    "rule_id": cwe_id,
-                    "rule_description": self.cwe_descriptions.get(cwe_id, ""),
-                    "original_rule_id": original_rule_id,
-                    "message": result.get("message", {}).get("text", ""),
-                    "file_path": file_path,
-                    "start_line": start_line,
-                    "end_line": end_line,
-                    "severity": self._get_severity_for_cwe(cwe_id, result),
-                    "snippet": snippet,
-                    "location_key": f"{file_path}:{start_line}-{end_line}",
-                    "original_result": result
-                }
+        results = (result for run in sarif_data.get("runs", []) for result in run.get("results", []))
+        return list(self._normalize_results(results, tool_name))
+    
+    def iter_findings(self, sarif_path: Path, tool_name: str) -> Iterator[Finding]:
+        """
+        Yield normalized findings straight from a SARIF file.
+        
+        With ijson installed the results arrays are stream-parsed one result at a time,
+        so the full SARIF tree is never materialized; otherwise falls back to json.load.
+        """
+        with open(sarif_path, 'rb') as f:
+            if IJSON_SUPPORT:
+                results = ijson.items(f, 'runs.item.results.item')
+            else:
+                results = (result for run in json.load(f).get("runs", []) for result in run.get("results", []))
+            
+            yield from self._normalize_results(results, tool_name)
+    
+    def _collect_findings(self, sarif_path: Path, tool_name: str) -> Optional[List[Finding]]:
+        """Read all findings from a SARIF file, returns None if it can't be parsed."""
+        try:
+            return list(self.iter_findings(sarif_path, tool_name))
+        except SARIF_LOAD_ERRORS as e:
+            logger.error(f"Failed to load SARIF file {sarif_path}: {e}")
+            return None
+    
+    def _normalize_results(self, results: Iterable[Dict], tool_name: str) -> Iterator[Finding]:
+        """Normalize SARIF results into findings, skipping results without a location."""
+        # Bind lookups once; this loop runs for every result in the report
+        normalize_file_path = self._normalize_file_path
+        extract_snippet = self._extract_snippet
+        extract_severity = self._extract_severity
+        rule_to_cwe_get = self.rule_to_cwe.get
+        cwe_descriptions_get = self.cwe_descriptions.get
+        cwe_to_severity_get = self.cwe_to_severity.get
+        location_ids = self._location_ids
+        location_ids_get = location_ids.get
+        location_keys = self._location_keys
+        location_lock = self._location_lock
+        
+        for result in results:
+            # Extract location info
+            locations = result.get("locations") or ()
+            if not locations:
+                continue
                 
-                findings.append(finding)
-        
-        return findings
+            location = locations[0].get("physicalLocation", {})
+            artifact = location.get("artifactLocation", {})
+            region = location.get("region", {})
+            
+            file_path = normalize_file_path(artifact.get("uri", ""))
+            start_line = region.get("startLine", 0)
+            end_line = region.get("endLine", start_line)
+            
+            location_key = (file_path, start_line, end_line)
+            location_id = location_ids_get(location_key)
+            if location_id is None:
+                # Both reports may be parsed at once, so new ids are handed out under the lock
+                with location_lock:
+                    location_id = location_ids_get(location_key)
+                    if location_id is None:
+                        location_id = len(location_keys)
+                        location_keys.append(f"{file_path}:{start_line}-{end_line}")
+                        location_ids[location_key] = location_id
+            
+            # Create normalized finding (same field order as Finding.__init__);
+            # rule and severity lookups are inlined _convert_to_cwe/_get_severity_for_cwe
+            original_rule_id = result.get("ruleId", "unknown")
+            cwe_id = rule_to_cwe_get(original_rule_id, original_rule_id)
+            yield Finding(
+                tool_name,
+                cwe_id,
+                cwe_descriptions_get(cwe_id, ""),
+                original_rule_id,
+                result.get("message", {}).get("text", ""),
+                file_path,
+                start_line,
+                end_line,
+                cwe_to_severity_get(cwe_id) or extract_severity(result),
+                extract_snippet(location),
+                location_id,
+                location_keys[location_id]
+            )
     
     def _extract_severity(self, result: Dict) -> str:
         """Extract severity from SARIF result."""
@@ -158,19 +353,16 @@ class SARIFReportMerger:
     
     def _normalize_severity(self, severity: str) -> str:
         """Normalize severity levels to LOW/MEDIUM/HIGH."""
-        severity_lower = severity.lower()
-        
-        if severity_lower in ["error", "high"]:
-            return "HIGH"
-        elif severity_lower in ["warning", "medium"]:
-            return "MEDIUM"
-        elif severity_lower in ["note", "info", "low"]:
-            return "LOW"
-        else:
-            return "LOW"  # default fallback
+        return _SEVERITY_MAP.get(severity.lower(), "LOW")
     
-    def _normalize_file_path(self, file_path: str) -> str:
-        """Normalize file path by removing file:// URI prefix and making it relative."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_file_path(file_path: str) -> str:
+        """
+        Normalize file path by removing file:// URI prefix and making it relative.
+        
+        Cached because one scan reports many findings per file.
+        """
         # # Remove file:// URI prefix first
         # if file_path.startswith("file://"):
         #     file_path = file_path[7:]  # Remove "file://"
@@ -191,13 +383,8 @@ class SARIFReportMerger:
     
     def _get_severity_for_cwe(self, cwe_id: str, sarif_result: Dict) -> str:
         """Get severity based on CWE mapping first, then fall back to SARIF severity."""
-        # First, try to get severity from CWE mapping
-        for severity_level, cwe_list in self.cwe_severity_mappings.items():
-            if cwe_id in cwe_list:
-                return severity_level
-        
-        # Fall back to SARIF-based severity extraction
-        return self._extract_severity(sarif_result)
+        # First, try to get severity from CWE mapping, then fall back to SARIF-based extraction
+        return self.cwe_to_severity.get(cwe_id) or self._extract_severity(sarif_result)
     
     def _extract_snippet(self, location: Dict) -> str:
         """Extract code snippet from SARIF location."""
@@ -216,142 +403,108 @@ class SARIFReportMerger:
         
         return ""
     
-    def match_findings(self, semgrep_findings: Optional[List[Dict]], bandit_findings: Optional[List[Dict]]) -> Dict:
-        """Match findings by location and categorize them."""
+    def iter_matched_findings(self, semgrep_findings: Optional[List[Finding]],
+                              bandit_findings: Optional[List[Finding]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Match findings by location, yielding (category, record) pairs.
+        
+        Records are the Finding itself for single-tool locations and a MatchedFinding pair for
+        "both"; each has a to_dict giving its report entry, so callers can project them one at a time.
+        """
         
         # Handle cases where one tool has no findings
         semgrep_findings = semgrep_findings or []
         bandit_findings = bandit_findings or []
         
         # Create location maps for efficient matching
-        semgrep_locations = {f["location_key"]: f for f in semgrep_findings}
-        bandit_locations = {f["location_key"]: f for f in bandit_findings}
-        
-        # Find matches
-        both_locations = set(semgrep_locations.keys()) & set(bandit_locations.keys())
-        semgrep_only = set(semgrep_locations.keys()) - set(bandit_locations.keys())
-        bandit_only = set(bandit_locations.keys()) - set(semgrep_locations.keys())
-        
-        categorized = {
-            "both": [],
-            "semgrep": [],
-            "bandit": []
-        }
+        semgrep_locations = {f.location_id: f for f in semgrep_findings}
+        bandit_locations = {f.location_id: f for f in bandit_findings}
         
-        # Add matched findings (both tools found issues at same location)
-        for location_key in both_locations:
-            semgrep_finding = semgrep_locations[location_key]
-            bandit_finding = bandit_locations[location_key]
-            
-            merged_finding = {
-                "category": "both",
-                "location_key": location_key,
-                "file_path": semgrep_finding["file_path"],
-                "start_line": semgrep_finding["start_line"],
-                "end_line": semgrep_finding["end_line"],
-                "snippet": semgrep_finding["snippet"] or bandit_finding["snippet"],
-                "semgrep": {
-                    "rule_id": semgrep_finding["rule_id"],
-                    "rule_description": semgrep_finding["rule_description"],
-                    "message": semgrep_finding["message"],
-                    "severity": semgrep_finding["severity"],
-                    "snippet": semgrep_finding["snippet"]
-                },
-                "bandit": {
-                    "rule_id": bandit_finding["rule_id"],
-                    "rule_description": bandit_finding["rule_description"],
-                    "message": bandit_finding["message"],
-                    "severity": bandit_finding["severity"],
-                    "snippet": bandit_finding["snippet"]
-                }
-            }
-            categorized["both"].append(merged_finding)
-        
-        # Add semgrep-only findings
-        for location_key in semgrep_only:
-            finding = semgrep_locations[location_key]
-            categorized["semgrep"].append({
-                "category": "semgrep",
-                "location_key": location_key,
-                "file_path": finding["file_path"],
-                "start_line": finding["start_line"],
-                "end_line": finding["end_line"],
-                "rule_id": finding["rule_id"],
-                "rule_description": finding["rule_description"],
-                "message": finding["message"],
-                "severity": finding["severity"],
-                "snippet": finding["snippet"]
-            })
+        # Single pass over semgrep: a location either matches bandit or is semgrep-only
+        for location_id, semgrep_finding in semgrep_locations.items():
+            bandit_finding = bandit_locations.get(location_id)
+            if bandit_finding is None:
+                yield "semgrep", semgrep_finding
+            else:
+                yield "both", MatchedFinding(semgrep_finding, bandit_finding)
         
         # Add bandit-only findings
-        for location_key in bandit_only:
-            finding = bandit_locations[location_key]
-            categorized["bandit"].append({
-                "category": "bandit",
-                "location_key": location_key,
-                "file_path": finding["file_path"],
-                "start_line": finding["start_line"],
-                "end_line": finding["end_line"],
-                "rule_id": finding["rule_id"],
-                "rule_description": finding["rule_description"],
-                "message": finding["message"],
-                "severity": finding["severity"],
-                "snippet": finding["snippet"]
-            })
-        
+        for location_id, finding in bandit_locations.items():
+            if location_id not in semgrep_locations:
+                yield "bandit", finding
+    
+    def match_findings(self, semgrep_findings: Optional[List[Finding]], bandit_findings: Optional[List[Finding]]) -> Dict:
+        """Match findings by location and categorize them into report entries."""
+        categorized = {category: [] for category in FINDING_CATEGORIES}
+        for category, record in self.iter_matched_findings(semgrep_findings, bandit_findings):
+            categorized[category].append(record.to_dict())
         return categorized
     
     def generate_summary(self, categorized: Dict) -> Dict:
         """Generate summary statistics."""
+        return self._summary_from_counts({category: len(findings) for category, findings in categorized.items()})
+    
+    @staticmethod
+    def _summary_from_counts(counts: Dict[str, int]) -> Dict:
+        """Summary statistics from per-category finding counts."""
+        both = counts.get("both", 0)
+        total = sum(counts.values())
+        # Both coverage figures share one denominator, since the only categories are both/semgrep/bandit
+        both_percentage = both / max(1, total) * 100
+        
         return {
-            "total_findings": sum(len(findings) for findings in categorized.values()),
-            "both_tools": len(categorized["both"]),
-            "semgrep_only": len(categorized["semgrep"]),
-            "bandit_only": len(categorized["bandit"]),
+            "total_findings": total,
+            "both_tools": both,
+            "semgrep_only": counts.get("semgrep", 0),
+            "bandit_only": counts.get("bandit", 0),
             "coverage": {
-                "both_percentage": len(categorized["both"]) / max(1, sum(len(findings) for findings in categorized.values())) * 100,
-                "agreement_rate": len(categorized["both"]) / max(1, len(categorized["both"]) + len(categorized["semgrep"]) + len(categorized["bandit"])) * 100
+                "both_percentage": both_percentage,
+                "agreement_rate": both_percentage
             }
         }
     
-    def merge_reports(self, output_file: str = "merged_sast_report.json") -> Dict:
-        """Main method to merge SARIF reports."""
-        
-        # Load SARIF files (only if they exist)
-        semgrep_data = None
-        bandit_data = None
-        
-        if self.semgrep_exists:
-            logger.info(f"Loading semgrep report: {self.semgrep_path}")
-            semgrep_data = self.load_sarif(self.semgrep_path)
-            if not semgrep_data:
-                logger.warning("Failed to load semgrep data, continuing without it")
-        else:
-            logger.info("Semgrep report not available, skipping")
-        
-        if self.bandit_exists:
-            logger.info(f"Loading bandit report: {self.bandit_path}")
-            bandit_data = self.load_sarif(self.bandit_path)
-            if not bandit_data:
-                logger.warning("Failed to load bandit data, continuing without it")
-        else:
-            logger.info("Bandit report not available, skipping")
-        
-        # Extract findings
-        logger.info("Extracting findings...")
-        semgrep_findings = self.extract_findings(semgrep_data, "semgrep") if semgrep_data else []
-        bandit_findings = self.extract_findings(bandit_data, "bandit") if bandit_data else []
+    def merge_reports(self, output_file: str = "merged_sast_report.json", streaming: bool = False) -> Dict:
+        """
+        Main method to merge SARIF reports.
+        
+        With streaming=True the report is written as NDJSON (a metadata/summary header line,
+        then one finding per line) so huge result sets can be written and read incrementally.
+        Findings are projected and written one at a time as they are matched, and only the
+        header ({"metadata", "summary", "findings_ndjson"}) is returned; read the findings
+        with iter_ndjson_report.
+        """
+        
+        # Stream findings out of the SARIF files (only if they exist); the two reports
+        # are independent until matching, so they are parsed in parallel
+        semgrep_future = None
+        bandit_future = None
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if self.semgrep_exists:
+                logger.info(f"Extracting findings from semgrep report: {self.semgrep_path} (streaming: {IJSON_SUPPORT})")
+                semgrep_future = executor.submit(self._collect_findings, self.semgrep_path, "semgrep")
+            else:
+                logger.info("Semgrep report not available, skipping")
+            
+            if self.bandit_exists:
+                logger.info(f"Extracting findings from bandit report: {self.bandit_path} (streaming: {IJSON_SUPPORT})")
+                bandit_future = executor.submit(self._collect_findings, self.bandit_path, "bandit")
+            else:
+                logger.info("Bandit report not available, skipping")
+        
+        semgrep_findings = semgrep_future.result() if semgrep_future else []
+        if semgrep_findings is None:
+            logger.warning("Failed to load semgrep data, continuing without it")
+            semgrep_findings = []
+        
+        bandit_findings = bandit_future.result() if bandit_future else []
+        if bandit_findings is None:
+            logger.warning("Failed to load bandit data, continuing without it")
+            bandit_findings = []
         
         logger.info(f"Found {len(semgrep_findings)} semgrep findings")
         logger.info(f"Found {len(bandit_findings)} bandit findings")
         
-        # Match and categorize findings
-        logger.info("Matching findings by location...")
-        categorized = self.match_findings(semgrep_findings, bandit_findings)
-        
-        # Generate summary
-        summary = self.generate_summary(categorized)
-        
         # Create final report
         metadata = {
             "generated_at": "2025-08-24T00:00:00Z"  # You could use datetime.now().isoformat()
@@ -368,16 +521,34 @@ class SARIFReportMerger:
             metadata["semgrep_missing"] = str(self.semgrep_path)
         if self.bandit_path and not self.bandit_exists:
             metadata["bandit_missing"] = str(self.bandit_path)
-            
-        merged_report = {
-            "metadata": metadata,
-            "summary": summary,
-            "findings": categorized
-        }
         
-        # Save report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_report, f, indent=2, ensure_ascii=False)
+        logger.info("Matching findings by location...")
+        if streaming:
+            # Matched records go straight to the file; no findings are kept in memory
+            summary = self._write_ndjson(metadata, self.iter_matched_findings(semgrep_findings, bandit_findings),
+                                         output_file)
+            merged_report = {
+                "metadata": metadata,
+                "summary": summary,
+                "findings_ndjson": True
+            }
+        else:
+            # Match and categorize findings into the report entries returned to the caller
+            categorized = self.match_findings(semgrep_findings, bandit_findings)
+            summary = self.generate_summary(categorized)
+            merged_report = {
+                "metadata": metadata,
+                "summary": summary,
+                "findings": categorized
+            }
+            
+            # Save report
+            if ORJSON_SUPPORT:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(merged_report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(merged_report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Merged report saved to: {output_file}")
         logger.info(f"Summary:")
@@ -388,6 +559,33 @@ class SARIFReportMerger:
         logger.info(f"  Agreement rate: {summary['coverage']['agreement_rate']:.1f}%")
         
         return merged_report
+    
+    def _write_ndjson(self, metadata: Dict, records: Iterable[Tuple[str, Any]], output_file: str) -> Dict:
+        """
+        Write matched records as NDJSON, one compact record per line, and return the summary.
+        
+        The header line is written first with a null summary and padded with spaces; once every
+        record has been written (and counted) the header is rewritten in place with the summary.
+        """
+        placeholder = _dumps_line({"metadata": metadata, "summary": None, "findings_ndjson": True})
+        header_size = len(placeholder) - 1 + NDJSON_HEADER_RESERVE
+        counts = dict.fromkeys(FINDING_CATEGORIES, 0)
+        
+        with open(output_file, 'wb') as f:
+            f.write(placeholder[:-1].ljust(header_size) + b"\n")
+            for category, record in records:
+                counts[category] += 1
+                f.write(_dumps_line(record.to_dict()))
+            
+            summary = self._summary_from_counts(counts)
+            header = _dumps_line({"metadata": metadata, "summary": summary, "findings_ndjson": True})[:-1]
+            if len(header) > header_size:
+                # The summary has a fixed set of numeric fields, so the reserve always covers it
+                raise ValueError(f"NDJSON header exceeds its reserved {header_size} bytes")
+            f.seek(0)
+            f.write(header.ljust(header_size))
+        
+        return summary
 
 
 def run_report_merger(**kwargs) -> Dict[str, Any]:
@@ -399,6 +597,8 @@ def run_report_merger(**kwargs) -> Dict[str, Any]:
         bandit_file (str, optional): Path to bandit SARIF file  
         output_file (str, optional): Output file path (default: 'merged_sast_report.json')
         mappings_file (str, optional): Path to rule mappings JSON file
+        streaming (bool, optional): Write the report as NDJSON, one finding per line, and return
+            merged_report as an iter_ndjson_report iterator over it (default: False)
         log_level (str, optional): Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
         
     Note: At least one of semgrep_file or bandit_file must be provided.
@@ -408,7 +608,7 @@ def run_report_merger(**kwargs) -> Dict[str, Any]:
         {
             "success": bool,
             "data": {
-                "merged_report": report dict or None,
+                "merged_report": report dict, NDJSON record iterator (streaming) or None,
                 "total_findings": int,
                 "semgrep_findings": int,
                 "bandit_findings": int,
@@ -442,13 +642,14 @@ def run_report_merger(**kwargs) -> Dict[str, Any]:
     bandit_file = kwargs.get('bandit_file')
     output_file = kwargs.get('output_file', 'merged_sast_report.json')
     mappings_file = kwargs.get('mappings_file')
+    streaming = kwargs.get('streaming', False)
     
     try:
         # Initialize merger
         merger = SARIFReportMerger(semgrep_file, bandit_file, mappings_file)
         
         # Run merge
-        merged_report = merger.merge_reports(output_file)
+        merged_report = merger.merge_reports(output_file, streaming=streaming)
         
         if merged_report is None:
             return {
@@ -464,15 +665,15 @@ def run_report_merger(**kwargs) -> Dict[str, Any]:
         
         # Extract summary data
         summary = merged_report.get("summary", {})
-        findings = merged_report.get("findings", {})
         
         return {
             "success": True,
             "data": {
-                "merged_report": merged_report,
+                # In streaming mode findings are only on disk; hand out a lazy reader instead
+                "merged_report": iter_ndjson_report(output_file) if streaming else merged_report,
                 "total_findings": summary.get("total_findings", 0),
-                "semgrep_findings": len(findings.get("semgrep", [])),
-                "bandit_findings": len(findings.get("bandit", [])),
+                "semgrep_findings": summary.get("semgrep_only", 0),
+                "bandit_findings": summary.get("bandit_only", 0),
                 "both_tools": summary.get("both_tools", 0),
                 "agreement_rate": summary.get("coverage", {}).get("agreement_rate", 0.0),
                 "output_file": output_file
@@ -3,24 +3,52 @@
 Simple SAST analyzer using semgrep for Python vulnerability detection.
 """
 
+import os
+import asyncio
 import subprocess
+import tempfile
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Errors that mean semgrep's JSON/SARIF output could not be parsed
+OUTPUT_PARSE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if IJSON_SUPPORT else ())
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
 class SemgrepAnalyzer:
-    def __init__(self, target_path: str, rules_path: Optional[str] = None):
-        self.target_path = Path(target_path)
+    def __init__(self, target_path: Union[str, List[str]], rules_path: Optional[str] = None, jobs: Optional[int] = None,
+                 timeout: Optional[int] = None, max_memory: Optional[int] = None):
+        # Several targets are scanned in one semgrep run, so rules are loaded and compiled only once
+        targets = [target_path] if isinstance(target_path, (str, os.PathLike)) else list(target_path)
+        if not targets:
+            raise ValueError("At least one target path is required")
+        self.target_paths = [Path(t) for t in targets]
+        self.target_path = self.target_paths[0]
         self.rules_path = Path(rules_path) if rules_path else Path(__file__).parent / "rules"
-        logger.debug(f"Initialized SemgrepAnalyzer - target: {self.target_path}, rules: {self.rules_path}")
+        # Parallel semgrep-core workers (default: all cores) and per-file rule limits
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timeout = timeout  # seconds per rule per file
+        self.max_memory = max_memory  # MB per file
+        logger.debug(f"Initialized SemgrepAnalyzer - targets: {[str(t) for t in self.target_paths]}, rules: {self.rules_path}, jobs: {self.jobs}")
         
-    def run_analysis(self, output_format: str = "json") -> Tuple[str, str, int]:
-        """Run semgrep analysis on target directory."""
+    def _build_command(self, output_format: str) -> list:
+        """Build the semgrep command line for the given output format."""
         format_flag = {
             "json": "--json",
             "sarif": "--sarif",
@@ -32,41 +60,110 @@ class SemgrepAnalyzer:
             "--config", str(self.rules_path),
             format_flag,
             "--no-git-ignore",  # Scan all files, not just git-tracked ones
-            str(self.target_path)
+            "--jobs", str(self.jobs)
         ]
         
+        # Bound slow rules so one hung file doesn't stall the whole scan
+        if self.timeout is not None:
+            cmd.extend(["--timeout", str(self.timeout)])
+        if self.max_memory is not None:
+            cmd.extend(["--max-memory", str(self.max_memory)])
+        
+        cmd.extend(str(t) for t in self.target_paths)
+        return cmd
+    
+    def run_analysis_to_file(self, output_file: str, output_format: str = "json") -> Tuple[str, int]:
+        """Run semgrep analysis with its stdout going straight to output_file, returns (stderr, returncode)."""
+        cmd = self._build_command(output_format)
+        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            return result.stdout, result.stderr, result.returncode
+            with open(output_file, 'wb') as f:
+                result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True, check=False)
+            return result.stderr, result.returncode
         except FileNotFoundError:
             raise Exception("Semgrep not found. Install with: pip install semgrep")
     
-    def analyze_and_save(self, output_file: str = "sast_results.json", output_format: str = "json") -> Optional[Any]:
-        """Run analysis and save results to file."""
-        stdout, stderr, returncode = self.run_analysis(output_format)
+    async def run_analysis_to_file_async(self, output_file: str, output_format: str = "json") -> Tuple[str, int]:
+        """Async variant of run_analysis_to_file, so the event loop stays free while semgrep runs."""
+        cmd = self._build_command(output_format)
         
+        try:
+            with open(output_file, 'wb') as f:
+                proc = await asyncio.create_subprocess_exec(*cmd, stdout=f, stderr=asyncio.subprocess.PIPE)
+                _, stderr = await proc.communicate()
+            return stderr.decode(errors='replace'), proc.returncode
+        except FileNotFoundError:
+            raise Exception("Semgrep not found. Install with: pip install semgrep")
+    
+    def _scan_to_file(self, output_file: str, output_format: str) -> bool:
+        """Run semgrep into a temp file next to output_file and move it into place if it succeeded."""
+        tmp_path = _temp_output_path(output_file)
+        try:
+            stderr, returncode = self.run_analysis_to_file(tmp_path, output_format)
+            return self._replace_if_ok(tmp_path, output_file, output_format, stderr, returncode)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    async def _scan_to_file_async(self, output_file: str, output_format: str) -> bool:
+        """Async variant of _scan_to_file."""
+        tmp_path = _temp_output_path(output_file)
+        try:
+            stderr, returncode = await self.run_analysis_to_file_async(tmp_path, output_format)
+            return self._replace_if_ok(tmp_path, output_file, output_format, stderr, returncode)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def _replace_if_ok(self, tmp_path: str, output_file: str, output_format: str, stderr: str, returncode: int) -> bool:
+        """Move a finished scan's temp file over output_file, leaving any previous report intact on failure."""
+        if not self._check_scan(tmp_path, output_format, stderr, returncode):
+            return False
+        os.replace(tmp_path, output_file)
+        return True
+    
+    def _check_scan(self, output_file: str, output_format: str, stderr: str, returncode: int) -> bool:
+        """Check a finished semgrep run, filling in an empty result set if it printed nothing."""
         if returncode != 0 and stderr:
             logger.error(f"Error running semgrep: {stderr}")
+            return False
+        
+        # Semgrep printed nothing: store an empty result set, as the stdout path always did
+        if output_format != "text" and os.path.getsize(output_file) == 0:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump({"results": []}, f, indent=2)
+        return True
+    
+    def analyze_and_save(self, output_file: str = "sast_results.json", output_format: str = "json",
+                         pretty: bool = False) -> Optional[Any]:
+        """
+        Run analysis and save results to file, returns the parsed results (text for text format).
+        
+        Semgrep's output is kept as written; pass pretty=True to re-indent the saved JSON/SARIF.
+        """
+        if not self._scan_to_file(output_file, output_format):
             return None
-            
-        # For text format, save as plain text
+        
+        # For text format, semgrep's output is the report as-is
         if output_format == "text":
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(stdout)
             logger.info(f"Analysis complete. Results saved to: {output_file}")
-            return stdout
-            
-        # For JSON and SARIF formats, parse and save
+            with open(output_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        # For JSON and SARIF formats, semgrep already wrote valid JSON; parse it once for the caller
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
         try:
-            results = json.loads(stdout) if stdout else {"results": []}
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            
-            # Count issues based on format
-            if output_format == "sarif":
-                issue_count = sum(len(run.get("results", [])) for run in results.get("runs", []))
+            if ORJSON_SUPPORT:
+                with open(output_file, 'rb') as f:
+                    results = orjson.loads(f.read())
             else:
-                issue_count = len(results.get("results", []))
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    results = json.load(f)
+            
+            issue_count = count_parsed_results(results, output_format)
+            
+            if pretty:
+                write_pretty_json(results, output_file)
                 
             logger.info(f"Analysis complete. Found {issue_count} issues.")
             logger.info(f"Results saved to: {output_file}")
@@ -76,20 +173,155 @@ class SemgrepAnalyzer:
             logger.error("Failed to parse semgrep output")
             return None
     
+    def analyze_to_file(self, output_file: str = "sast_results.json", output_format: str = "json",
+                        pretty: bool = False) -> Optional[int]:
+        """
+        Run analysis and save results to file without loading them into memory.
+        
+        Semgrep writes its output directly to output_file and results are only stream-counted
+        (via ijson when available). Returns the issue count, -1 for text format, or None on failure.
+        pretty=True re-indents the saved JSON/SARIF, which does load it once.
+        """
+        if not self._scan_to_file(output_file, output_format):
+            return None
+        return self._count_saved(output_file, output_format, pretty)
+    
+    async def analyze_to_file_async(self, output_file: str = "sast_results.json",
+                                    output_format: str = "json", pretty: bool = False) -> Optional[int]:
+        """
+        Async variant of analyze_to_file.
+        
+        Several scans (e.g. one per target or format) can be awaited together with asyncio.gather,
+        each semgrep process running while the others' output is being counted.
+        """
+        if not await self._scan_to_file_async(output_file, output_format):
+            return None
+        return self._count_saved(output_file, output_format, pretty)
+    
+    def _count_saved(self, output_file: str, output_format: str, pretty: bool = False) -> Optional[int]:
+        """Count issues in a saved semgrep output file, -1 for text format or None if it can't be parsed."""
+        if output_format == "text":
+            logger.info(f"Analysis complete. Results saved to: {output_file}")
+            return -1
+        
+        try:
+            if pretty:
+                reindent_json_file(output_file)
+            issue_count = count_results(output_file, output_format)
+        except OUTPUT_PARSE_ERRORS:
+            logger.error("Failed to parse semgrep output")
+            return None
+        
+        logger.info(f"Analysis complete. Found {issue_count} issues.")
+        logger.info(f"Results saved to: {output_file}")
+        return issue_count
+    
     def analyze_sarif(self, output_file: str = "sast_results.sarif") -> Optional[Any]:
         """Run analysis and save results in SARIF format."""
         return self.analyze_and_save(output_file, "sarif")
 
 
+def _temp_output_path(output_file: str) -> str:
+    """Create an empty temp file in output_file's directory, so os.replace onto it stays atomic."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)), suffix=".tmp")
+    os.close(fd)
+    return tmp_path
+
+
+def write_pretty_json(data: Any, output_file: str) -> None:
+    """Write data to output_file as indented JSON."""
+    if ORJSON_SUPPORT:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def reindent_json_file(output_file: str) -> None:
+    """Re-indent a saved JSON file in place."""
+    if ORJSON_SUPPORT:
+        with open(output_file, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    write_pretty_json(data, output_file)
+
+
+def count_results(output_file: str, output_format: str = "json") -> int:
+    """
+    Count results in a semgrep JSON or SARIF output file.
+    
+    With ijson installed the file is stream-parsed and only result starts are counted,
+    so no result objects are built; otherwise falls back to json.load.
+    """
+    with open(output_file, 'rb') as f:
+        if IJSON_SUPPORT:
+            item_prefix = "runs.item.results.item" if output_format == "sarif" else "results.item"
+            return sum(1 for prefix, event, _ in ijson.parse(f) if event == "start_map" and prefix == item_prefix)
+        results = json.load(f)
+    return count_parsed_results(results, output_format)
+
+
+def count_parsed_results(results: Dict[str, Any], output_format: str = "json") -> int:
+    """Count results in parsed semgrep JSON or SARIF output."""
+    if output_format == "sarif":
+        return sum(len(run.get("results", [])) for run in results.get("runs", []))
+    return len(results.get("results", []))
+
+
+def _result_path(result: Dict[str, Any]) -> str:
+    """File path of a semgrep JSON result ("path") or SARIF result (first location's artifact URI)."""
+    if "path" in result:
+        return result["path"]
+    locations = result.get("locations") or [{}]
+    uri = locations[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "")
+    return uri[len("file://"):] if uri.startswith("file://") else uri
+
+
+def split_results_by_target(results: Dict[str, Any], target_paths: List[Any],
+                            output_format: str = "json") -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Split the parsed output of a multi-target semgrep run back per target, by each result's file path.
+    
+    Results are assigned to the most specific target containing them; results matching no target are dropped.
+    """
+    if output_format == "sarif":
+        items = [result for run in results.get("runs", []) for result in run.get("results", [])]
+    else:
+        items = results.get("results", [])
+    
+    # Longest target first, so nested targets win over their parents
+    prefixes = sorted(((os.path.normpath(str(t)), str(t)) for t in target_paths), key=lambda p: len(p[0]), reverse=True)
+    by_target = {str(t): [] for t in target_paths}
+    
+    for result in items:
+        path = os.path.normpath(_result_path(result))
+        for prefix, target in prefixes:
+            if path == prefix or path.startswith(prefix + os.sep) or prefix == ".":
+                by_target[target].append(result)
+                break
+    
+    return by_target
+
+
 def run_semgrep_analysis(**kwargs) -> Dict[str, Any]:
     """
     Agent-friendly helper function for running Semgrep analysis.
     
     Args:
-        target_path (str): Path to the code to analyze (required)
+        target_path (str or list): Path to the code to analyze, or several paths to scan in one run (required)
         rules_path (str, optional): Path to Semgrep rules file
         output_file (str, optional): Output file path (default: 'sast_results.json')
         output_format (str, optional): Output format ('json', 'sarif', 'text')
+        jobs (int, optional): Number of parallel semgrep jobs (default: CPU count)
+        timeout (int, optional): Max seconds per rule per file (default: semgrep's own)
+        max_memory (int, optional): Max memory in MB per file scan (default: semgrep's own)
+        pretty (bool, optional): Re-indent the saved JSON/SARIF output (default: False, kept as semgrep wrote it)
+        load_results (bool, optional): Also parse the saved output and return it in data["results"]
+            (default: True); with several targets it is also split per target in data["results_by_target"].
+            Pass False for large scans to only stream-count the saved output, leaving data["results"] None
         log_level (str, optional): Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
         
     Returns:
@@ -97,7 +329,8 @@ def run_semgrep_analysis(**kwargs) -> Dict[str, Any]:
         {
             "success": bool,
             "data": {
-                "results": parsed results or None,
+                "results": parsed JSON/SARIF results with load_results, otherwise None,
+                "results_by_target": {target: [results]} with load_results and several targets, otherwise None,
                 "issue_count": int,
                 "output_file": str,
                 "output_format": str
@@ -127,15 +360,35 @@ def run_semgrep_analysis(**kwargs) -> Dict[str, Any]:
     rules_path = kwargs.get('rules_path')
     output_file = kwargs.get('output_file', 'sast_results.json')
     output_format = kwargs.get('output_format', 'json')
+    jobs = kwargs.get('jobs')
+    timeout = kwargs.get('timeout')
+    max_memory = kwargs.get('max_memory')
+    pretty = kwargs.get('pretty', False)
+    load_results = kwargs.get('load_results', True)
     
     try:
         # Initialize analyzer
-        analyzer = SemgrepAnalyzer(target_path=target_path, rules_path=rules_path)
+        analyzer = SemgrepAnalyzer(target_path=target_path, rules_path=rules_path, jobs=jobs,
+                                   timeout=timeout, max_memory=max_memory)
         
-        # Run analysis
-        results = analyzer.analyze_and_save(output_file=output_file, output_format=output_format)
+        # Run analysis; semgrep output goes straight to disk and is only parsed if the caller wants it
+        results = None
+        results_by_target = None
+        if load_results:
+            parsed = analyzer.analyze_and_save(output_file=output_file, output_format=output_format, pretty=pretty)
+            if parsed is None:
+                issue_count = None
+            elif output_format == "text":
+                issue_count = -1
+            else:
+                results = parsed
+                issue_count = count_parsed_results(results, output_format)
+                if len(analyzer.target_paths) > 1:
+                    results_by_target = split_results_by_target(results, analyzer.target_paths, output_format)
+        else:
+            issue_count = analyzer.analyze_to_file(output_file=output_file, output_format=output_format, pretty=pretty)
         
-        if results is None:
+        if issue_count is None:
             return {
                 "success": False,
                 "data": None,
@@ -146,21 +399,12 @@ def run_semgrep_analysis(**kwargs) -> Dict[str, Any]:
                 }
             }
         
-        # Calculate issue count based on format
-        issue_count = 0
-        if output_format == "text":
-            # For text format, we can't easily count issues
-            issue_count = -1  # Indicates count not available
-        elif output_format == "sarif" and isinstance(results, dict):
-            issue_count = sum(len(run.get("results", [])) for run in results.get("runs", []))
-        elif isinstance(results, dict):
-            issue_count = len(results.get("results", []))
-        
         return {
             "success": True,
             "data": {
-                "results": results if output_format != "text" else None,
-                "issue_count": issue_count,
+                "results": results,
+                "results_by_target": results_by_target,
+                "issue_count": issue_count,  # -1 for text format (count not available)
                 "output_file": output_file,
                 "output_format": output_format
             },
@@ -4,15 +4,93 @@ Snippet Extractor - Extracts code snippets from vulnerable locations
 and creates detailed vulnerability objects with code context.
 """
 
+import os
+import re
 import json
 import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Snippet extraction is file I/O bound, so threads (not processes) overlap the reads
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Line templates for snippets: line number, then a marker for the vulnerable lines
+VULNERABLE_LINE_TEMPLATE = "%4d >>> %s"
+CONTEXT_LINE_TEMPLATE = "%4d     %s"
+
+# Evidence location strings: 'path:start' or 'path:start-end' (the path may itself contain ':')
+_LOC_RE = re.compile(r'^(.*):\s*(\d+)\s*(?:-\s*(\d+)\s*)?$')
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+def _format_lines(template: str, lines: List[str], first_line_num: int) -> str:
+    """Number and join a window of source lines using a %-style template."""
+    return "\n".join([template % (line_num, line.rstrip()) for line_num, line in enumerate(lines, first_line_num)])
+
+
+class VulnSnippet:
+    """Vulnerability with its code snippet, for a single evidence location."""
+    __slots__ = ("vulnerability", "file", "start_line", "end_line", "vulnerable_lines_only",
+                 "before", "after", "risk", "severity", "cwe", "source")
+    
+    def __init__(self, vulnerability: str, file: str, start_line: int, end_line: int, vulnerable_lines_only: str,
+                 before: str, after: str, risk: str, severity: str, cwe: str, source: str):
+        self.vulnerability = vulnerability
+        self.file = file
+        self.start_line = start_line
+        self.end_line = end_line
+        self.vulnerable_lines_only = vulnerable_lines_only
+        self.before = before
+        self.after = after
+        self.risk = risk
+        self.severity = severity
+        self.cwe = cwe
+        self.source = source
+    
+    @property
+    def location(self) -> Dict[str, Any]:
+        """Location entry as written to the snippet report."""
+        return {
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "vulnerable_lines_only": self.vulnerable_lines_only
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the vulnerability entry used in the snippet report."""
+        return {
+            "vulnerability": self.vulnerability,
+            "file": self.file,
+            "location": self.location,
+            "context": {
+                "before": self.before,
+                "after": self.after
+            },
+            "risk": self.risk,
+            "severity": self.severity,
+            "cwe": self.cwe,
+            "sources": [self.source]
+        }
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON hook: project snippets into report dicts only when they are written."""
+    if isinstance(obj, VulnSnippet):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class SnippetExtractor:
     """
     Extracts code snippets from vulnerability locations identified in SAST triage reports.
@@ -42,7 +120,14 @@ class SnippetExtractor:
         """
         self.triage_analysis_path = triage_analysis_path
         self.code_base_path = code_base_path
-        logger.debug(f"Initialized SnippetExtractor - triage: {triage_analysis_path}, code_base: {code_base_path}")
+        # Normalized once so report paths can be joined with plain string ops
+        self._code_base_str = str(Path(code_base_path)) if code_base_path else ""
+        # Lines per resolved path; many findings share a file, so each file is read once per extractor
+        self._file_cache: Dict[str, List[str]] = {}
+        # Last extraction result and its severity buckets, built while extracting for the markdown report
+        self._snippets: Optional[List[VulnSnippet]] = None
+        self._by_severity: Dict[str, List[VulnSnippet]] = {}
+        logger.debug("Initialized SnippetExtractor - triage: %s, code_base: %s", triage_analysis_path, code_base_path)
         
         # Load triage analysis report
         self.triage_data = self._load_json(triage_analysis_path)
@@ -51,19 +136,34 @@ class SnippetExtractor:
     def _load_json(self, file_path: str) -> Dict[str, Any]:
         """Load JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"Loaded: {file_path}")
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+            if ORJSON_SUPPORT:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            logger.info("Loaded: %s", file_path)
             return data
         except FileNotFoundError:
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {file_path}: {e}")
+            logger.error("Invalid JSON in %s: %s", file_path, e)
             raise
     
     def _read_file_lines(self, file_path: str) -> List[str]:
-        """Read a file and return lines."""
+        """Read a file and return lines (cached per resolved path; callers must not mutate the list)."""
+        full_path = self._resolve_path(file_path)
+        
+        lines = self._file_cache.get(full_path)
+        if lines is None:
+            # Concurrent misses on one file may both read it; the result is the same either way
+            lines = self._file_cache[full_path] = self._load_lines(full_path, file_path)
+        return lines
+    
+    def _resolve_path(self, file_path: str) -> str:
+        """Resolve a report file path against code_base_path."""
         full_path = file_path
         
         # If file_path starts with /, it's likely a prefix we need to remove
@@ -89,27 +189,34 @@ class SnippetExtractor:
                 relative_path = path_without_leading_slash
             
             # If we have a code_base_path, join with the relative path
-            if self.code_base_path:
-                full_path = str(Path(self.code_base_path) / relative_path)
+            if self._code_base_str:
+                full_path = os.path.join(self._code_base_str, relative_path)
             else:
                 full_path = relative_path
-        elif self.code_base_path and not file_path.startswith("/"):
+        elif self._code_base_str:
             # Handle regular relative paths
-            full_path = str(Path(self.code_base_path) / file_path)
-        
-        logger.debug(f"Looking for file: {file_path} -> {full_path}")
+            full_path = os.path.join(self._code_base_str, file_path)
         
+        logger.debug("Looking for file: %s -> %s", file_path, full_path)
+        return full_path
+    
+    def _load_lines(self, full_path: str, file_path: str) -> List[str]:
+        """Read lines from disk, returns [] if the file can't be read."""
         try:
             with open(full_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            logger.debug(f"Read {len(lines)} lines from: {full_path}")
+                # One read and one C-level split; text mode already turned \r\n into \n.
+                # split() rather than splitlines() so \f and friends don't add lines, as with readlines()
+                lines = f.read().split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            logger.debug("Read %d lines from: %s", len(lines), full_path)
             return lines
         except FileNotFoundError:
-            logger.warning(f"File not found: {full_path}")
-            logger.debug(f"Also tried: {file_path}")
+            logger.warning("File not found: %s", full_path)
+            logger.debug("Also tried: %s", file_path)
             return []
         except Exception as e:
-            logger.error(f"Error reading file {full_path}: {e}")
+            logger.error("Error reading file %s: %s", full_path, e)
             return []
     
     def _extract_snippet(self, 
@@ -129,8 +236,14 @@ class SnippetExtractor:
         Returns:
             Dictionary with vulnerable_lines_only, before_context, after_context
         """
-        lines = self._read_file_lines(file_path)
-        
+        return self._snippet_from_lines(self._read_file_lines(file_path), start_line, end_line, context_lines)
+    
+    def _snippet_from_lines(self,
+                            lines: List[str],
+                            start_line: int,
+                            end_line: int,
+                            context_lines: int) -> Dict[str, str]:
+        """Cut the snippet and its context out of already-read file lines (see _extract_snippet)."""
         if not lines:
             return {
                 "vulnerable_lines_only": "// Unable to read source file",
@@ -138,34 +251,15 @@ class SnippetExtractor:
                 "after_context": ""
             }
         
-        # Adjust for 0-indexed array (file lines are 1-indexed)
-        start_idx = start_line - 1
+        # Adjust for 0-indexed array (file lines are 1-indexed); slices clamp to the file
+        start_idx = max(0, start_line - 1)
         end_idx = end_line
-        
-        # Extract vulnerable lines only
-        vulnerable_lines = []
-        for i in range(start_idx, min(end_idx, len(lines))):
-            line_num = i + 1
-            vulnerable_lines.append(f"{line_num:4d} >>> {lines[i].rstrip()}")
-        
-        # Extract context before
-        before_start_idx = max(0, start_line - 1 - context_lines)
-        before_lines = []
-        for i in range(before_start_idx, start_idx):
-            line_num = i + 1
-            before_lines.append(f"{line_num:4d}     {lines[i].rstrip()}")
-        
-        # Extract context after
-        after_end_idx = min(len(lines), end_line + context_lines)
-        after_lines = []
-        for i in range(end_idx, after_end_idx):
-            line_num = i + 1
-            after_lines.append(f"{line_num:4d}     {lines[i].rstrip()}")
+        before_start_idx = max(0, start_idx - context_lines)
         
         return {
-            "vulnerable_lines_only": "\n".join(vulnerable_lines),
-            "before_context": "\n".join(before_lines),
-            "after_context": "\n".join(after_lines)
+            "vulnerable_lines_only": _format_lines(VULNERABLE_LINE_TEMPLATE, lines[start_idx:end_idx], start_idx + 1),
+            "before_context": _format_lines(CONTEXT_LINE_TEMPLATE, lines[before_start_idx:start_idx], before_start_idx + 1),
+            "after_context": _format_lines(CONTEXT_LINE_TEMPLATE, lines[end_idx:end_idx + context_lines], end_idx + 1)
         }
     
     def _parse_location(self, location: str) -> tuple[str, int, int]:
@@ -175,27 +269,18 @@ class SnippetExtractor:
         Returns:
             Tuple of (file_path, start_line, end_line)
         """
+        match = _LOC_RE.match(location)
+        if match:
+            file_path, start_line, end_line = match.groups()
+            start_line = int(start_line)
+            return file_path, start_line, int(end_line) if end_line else start_line
+        
+        # No usable line range: keep the path part for the caller's warning
         if ":" not in location:
             return location, 0, 0
-        
-        file_path, line_range = location.rsplit(":", 1)
-        
-        if "-" in line_range:
-            start_line, end_line = line_range.split("-")
-            try:
-                start_line = int(start_line)
-                end_line = int(end_line)
-            except ValueError:
-                start_line = end_line = 0
-        else:
-            try:
-                start_line = end_line = int(line_range)
-            except ValueError:
-                start_line = end_line = 0
-        
-        return file_path, start_line, end_line
+        return location.rsplit(":", 1)[0], 0, 0
 
-    def extract_vulnerability_snippets(self, context_lines: int = 3) -> List[Dict[str, Any]]:
+    def extract_vulnerability_snippets(self, context_lines: int = 3) -> List[VulnSnippet]:
         """
         Extract code snippets for all vulnerabilities from triage analysis.
         
@@ -203,11 +288,15 @@ class SnippetExtractor:
             context_lines: Number of context lines to include around vulnerable code
             
         Returns:
-            List of vulnerability objects with code snippets
+            List of VulnSnippet objects (to_dict() gives the report entry)
         """
-        logger.info(f"Extracting code snippets for {len(self.vulnerabilities)} vulnerabilities...")
+        logger.info("Extracting code snippets for %d vulnerabilities...", len(self.vulnerabilities))
         
-        extracted_vulnerabilities = []
+        # First pass: resolve evidence locations and group them by file, stamping each
+        # with its position in the report so the output order can be restored
+        by_file = defaultdict(list)
+        severity_indexes = defaultdict(list)
+        total = 0
         
         for vuln in self.vulnerabilities:
             # Extract basic vulnerability info - now using English field names
@@ -238,62 +327,100 @@ class SnippetExtractor:
             # Process each representative evidence location
             evidence = vuln.get("RepresentativeEvidence", [])
             if not isinstance(evidence, list):
-                logger.warning(f"No valid evidence for vulnerability: {vulnerability_name}")
+                logger.warning("No valid evidence for vulnerability: %s", vulnerability_name)
                 continue
             
+            vuln_meta = {
+                "vulnerability": vulnerability_name,
+                "risk": risk,
+                "severity": severity,
+                "cwe": cwe,
+                "source": vuln.get("Source", "unknown")
+            }
             for evidence_item in evidence:
-                # New structure: direct file, start_line, end_line
-                if "file" in evidence_item and "start_line" in evidence_item:
-                    file_path = evidence_item.get("file", "")
-                    start_line = evidence_item.get("start_line", 0)
-                    end_line = evidence_item.get("end_line", start_line)
-                # Old structure: location string
-                elif "location" in evidence_item:
-                    location = evidence_item.get("location", "")
-                    if not location:
-                        continue
-                    file_path, start_line, end_line = self._parse_location(location)
-                else:
+                location = self._evidence_location(evidence_item)
+                if location is None:
                     continue
-                
-                if start_line == 0 and end_line == 0:
-                    logger.warning(f"No valid line numbers for {file_path}")
-                    continue
-                
-                # Extract code snippet
-                snippet_data = self._extract_snippet(
-                    file_path, 
-                    start_line, 
-                    end_line,
-                    context_lines
-                )
-                
-                # Create vulnerability object with new format
-                vuln_with_snippet = {
-                    "vulnerability": vulnerability_name,
-                    "file": file_path,
-                    "location": {
-                        "start_line": start_line,
-                        "end_line": end_line,
-                        "vulnerable_lines_only": snippet_data["vulnerable_lines_only"]
-                    },
-                    "context": {
-                        "before": snippet_data["before_context"],
-                        "after": snippet_data["after_context"]
-                    },
-                    "risk": risk,
-                    "severity": severity,
-                    "cwe": cwe,
-                    "sources": [vuln.get("Source", "unknown")]
-                }
-                
-                extracted_vulnerabilities.append(vuln_with_snippet)
+                file_path, start_line, end_line = location
+                by_file[file_path].append((total, vuln_meta, start_line, end_line))
+                severity_indexes[severity].append(total)
+                total += 1
+        
+        # Second pass: one task per file reads it once and cuts all of its snippets;
+        # files are processed in parallel and results put back in report order
+        extracted_vulnerabilities = [None] * total
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            for file_results in executor.map(self._process_file, by_file.keys(), by_file.values(), repeat(context_lines)):
+                for index, vuln_with_snippet in file_results:
+                    extracted_vulnerabilities[index] = vuln_with_snippet
+        
+        self._snippets = extracted_vulnerabilities
+        self._by_severity = {
+            severity: [extracted_vulnerabilities[index] for index in indexes]
+            for severity, indexes in severity_indexes.items()
+        }
         
-        logger.info(f"Extracted snippets for {len(extracted_vulnerabilities)} vulnerabilities")
+        logger.info("Extracted snippets for %d vulnerabilities", len(extracted_vulnerabilities))
         return extracted_vulnerabilities
     
+    def _evidence_location(self, evidence_item: Dict[str, Any]) -> Optional[Tuple[str, int, int]]:
+        """
+        Get (file_path, start_line, end_line) from an evidence item.
+        
+        Returns:
+            Location tuple, or None if the evidence has no usable location
+        """
+        # New structure: direct file, start_line, end_line
+        if "file" in evidence_item and "start_line" in evidence_item:
+            file_path = evidence_item.get("file", "")
+            start_line = evidence_item.get("start_line", 0)
+            end_line = evidence_item.get("end_line", start_line)
+        # Old structure: location string
+        elif "location" in evidence_item:
+            location = evidence_item.get("location", "")
+            if not location:
+                return None
+            file_path, start_line, end_line = self._parse_location(location)
+        else:
+            return None
+        
+        if start_line == 0 and end_line == 0:
+            logger.warning("No valid line numbers for %s", file_path)
+            return None
+        
+        return file_path, start_line, end_line
+    
+    def _process_file(self,
+                      file_path: str,
+                      items: List[Tuple[int, Dict[str, Any], int, int]],
+                      context_lines: int) -> List[Tuple[int, VulnSnippet]]:
+        """
+        Build vulnerability objects with code snippets for all evidence in one file.
+        
+        Args:
+            file_path: Source file path as given in the report
+            items: (report index, vulnerability fields, start_line, end_line) per evidence item
+            context_lines: Number of context lines to include around vulnerable code
+            
+        Returns:
+            (report index, VulnSnippet) pairs
+        """
+        lines = self._read_file_lines(file_path)
+        results = []
+        
+        for index, vuln_meta, start_line, end_line in items:
+            snippet_data = self._snippet_from_lines(lines, start_line, end_line, context_lines)
+            
+            results.append((index, VulnSnippet(
+                vuln_meta["vulnerability"], file_path, start_line, end_line,
+                snippet_data["vulnerable_lines_only"], snippet_data["before_context"], snippet_data["after_context"],
+                vuln_meta["risk"], vuln_meta["severity"], vuln_meta["cwe"], vuln_meta["source"]
+            )))
+        
+        return results
+    
     def save_snippet_report(self, 
-                           vulnerabilities: List[Dict[str, Any]], 
+                           vulnerabilities: List[VulnSnippet], 
                            output_file: str) -> None:
         """Save vulnerability snippets to JSON file."""
         report = {
@@ -306,49 +433,55 @@ class SnippetExtractor:
             "vulnerabilities": vulnerabilities
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if ORJSON_SUPPORT:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, default=_json_default, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=_json_default)
         
-        logger.info(f"Snippet report saved to: {output_file}")
+        logger.info("Snippet report saved to: %s", output_file)
     
     def generate_markdown_report(self, 
-                                vulnerabilities: List[Dict[str, Any]], 
+                                vulnerabilities: List[VulnSnippet], 
                                 output_file: str) -> None:
         """Generate a markdown report with code snippets."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# Vulnerability Report with Code Snippets\n\n")
-            f.write(f"Total vulnerabilities: {len(vulnerabilities)}\n\n")
-            
-            # Group by severity
-            by_severity = {}
+        # Build the report in memory and write it in one go instead of many small writes
+        out = [
+            "# Vulnerability Report with Code Snippets\n\n",
+            f"Total vulnerabilities: {len(vulnerabilities)}\n\n"
+        ]
+        
+        # Group by severity; reuse the buckets built during extraction when given its result
+        if vulnerabilities is self._snippets:
+            by_severity = self._by_severity
+        else:
+            by_severity = defaultdict(list)
             for vuln in vulnerabilities:
-                severity = vuln.get("severity", "UNKNOWN")
-                if severity not in by_severity:
-                    by_severity[severity] = []
-                by_severity[severity].append(vuln)
-            
-            # Write vulnerabilities by severity
-            for severity in ["HIGH", "MEDIUM", "LOW", "UNKNOWN"]:
-                if severity not in by_severity:
-                    continue
-                    
-                f.write(f"## {severity} Severity ({len(by_severity[severity])} issues)\n\n")
+                by_severity[vuln.severity].append(vuln)
+        
+        # Write vulnerabilities by severity
+        for severity in ["HIGH", "MEDIUM", "LOW", "UNKNOWN"]:
+            if severity not in by_severity:
+                continue
                 
-                for i, vuln in enumerate(by_severity[severity], 1):
-                    f.write(f"### {i}. {vuln['vulnerability']}\n\n")
-                    f.write(f"**File:** `{vuln['file']}`\n")
-                    f.write(f"**Location:** Lines {vuln['location']}\n")
-                    f.write(f"**CWE:** {vuln['cwe']}\n")
-                    f.write(f"**Risk:** {vuln['risk']}\n\n")
-                    
-                    f.write("**Vulnerable Code:**\n```python\n")
-                    f.write(vuln['location']['vulnerable_lines_only'])
-                    f.write("\n```\n\n")
-                    
-                    
-                    f.write("---\n\n")
-        
-        logger.info(f"Markdown report saved to: {output_file}")
+            out.append(f"## {severity} Severity ({len(by_severity[severity])} issues)\n\n")
+            
+            for i, vuln in enumerate(by_severity[severity], 1):
+                out.append(f"### {i}. {vuln.vulnerability}\n\n"
+                           f"**File:** `{vuln.file}`\n"
+                           f"**Location:** Lines {vuln.location}\n"
+                           f"**CWE:** {vuln.cwe}\n"
+                           f"**Risk:** {vuln.risk}\n\n"
+                           "**Vulnerable Code:**\n```python\n")
+                out.append(vuln.vulnerable_lines_only)
+                out.append("\n```\n\n"
+                           "---\n\n")
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write("".join(out))
+        
+        logger.info("Markdown report saved to: %s", output_file)
 
 
 def run_snippet_extractor(**kwargs) -> Dict[str, Any]:
@@ -420,21 +553,21 @@ def run_snippet_extractor(**kwargs) -> Dict[str, Any]:
         
         # Show samples if requested
         if show_samples and vulnerabilities:
-            logger.info(f"Sample extracted vulnerabilities:")
+            logger.info("Sample extracted vulnerabilities:")
             for vuln in vulnerabilities[:2]:  # Show first 2
-                logger.info(f"{vuln['vulnerability']}")
-                logger.info(f"  File: {vuln['file']} (lines {vuln['location']})")
-                logger.info(f"  Severity: {vuln['severity']}")
-                logger.info(f"  Risk: {vuln['risk'][:100]}...")
-                logger.debug(f"  Code snippet preview:")
-                snippet_lines = vuln['location']['vulnerable_lines_only'].split('\n')[:5]
-                for line in snippet_lines:
-                    logger.debug(f"    {line}")
+                logger.info("%s", vuln.vulnerability)
+                logger.info("  File: %s (lines %s)", vuln.file, vuln.location)
+                logger.info("  Severity: %s", vuln.severity)
+                logger.info("  Risk: %.100s...", vuln.risk)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  Code snippet preview:")
+                    for line in vuln.vulnerable_lines_only.split('\n')[:5]:
+                        logger.debug("    %s", line)
         
         return {
             "success": True,
             "data": {
-                "vulnerabilities": vulnerabilities,
+                "vulnerabilities": [vuln.to_dict() for vuln in vulnerabilities],
                 "total_snippets": len(vulnerabilities),
                 "output_file": output_file,
                 "markdown_output": markdown_output,
@@ -495,18 +628,18 @@ def extract_snippets(
     
     # Show samples if requested
     if show_samples and vulnerabilities:
-        logger.info(f"Sample extracted vulnerabilities:")
+        logger.info("Sample extracted vulnerabilities:")
         for vuln in vulnerabilities[:2]:  # Show first 2
-            logger.info(f"{vuln['vulnerability']}")
-            logger.info(f"  File: {vuln['file']} (lines {vuln['location']})")
-            logger.info(f"  Severity: {vuln['severity']}")
-            logger.info(f"  Risk: {vuln['risk'][:100]}...")
-            logger.debug(f"  Code snippet preview:")
-            snippet_lines = vuln['location']['vulnerable_lines_only'].split('\n')[:5]
-            for line in snippet_lines:
-                logger.debug(f"    {line}")
+            logger.info("%s", vuln.vulnerability)
+            logger.info("  File: %s (lines %s)", vuln.file, vuln.location)
+            logger.info("  Severity: %s", vuln.severity)
+            logger.info("  Risk: %.100s...", vuln.risk)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Code snippet preview:")
+                for line in vuln.vulnerable_lines_only.split('\n')[:5]:
+                    logger.debug("    %s", line)
     
-    return vulnerabilities
+    return [vuln.to_dict() for vuln in vulnerabilities]
 
 
 def main():
@@ -534,10 +667,7 @@ def main():
         # Example: Count by severity
         vulnerabilities = data['vulnerabilities']
         if vulnerabilities:
-            severity_counts = {}
-            for vuln in vulnerabilities:
-                severity = vuln.get("severity", "UNKNOWN")
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            severity_counts = Counter(vuln.get("severity", "UNKNOWN") for vuln in vulnerabilities)
             
             print(f"Summary by severity:")
             for severity, count in severity_counts.items():
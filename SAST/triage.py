@@ -6,14 +6,48 @@ Processes SAST findings and provides vulnerability triage with human-readable an
 
 import json
 import argparse
+import asyncio
+import hashlib
 import logging
+import mmap
+import os
+import re
 import sys
+import tempfile
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+try:
+    import tiktoken
+    TIKTOKEN_SUPPORT = True
+except ImportError:
+    TIKTOKEN_SUPPORT = False
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Triage responses cached per (model, template, prompt); only for near-deterministic sampling
+TRIAGE_CACHE_DIR = Path.home() / ".cache" / "cryptoslon" / "triage"
+MAX_CACHEABLE_TEMPERATURE = 0.2
+
+# Template variables are written as {{variable}}
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Findings are trimmed from the prompt least severe first
+_SEVERITY_RANK = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
+# Token estimates use this tiktoken encoding, or ~4 characters per token without it
+TOKEN_ENCODING = "o200k_base"
+_token_encoding = None
+
 # Add parent directory to path to import LLMs and prompts
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -21,185 +55,610 @@ from LLMs.factory import get_llm_client
 from prompts.PromptManager import PromptManager
 from progress_indicator import ProgressIndicator
 
+
+def _split_template_messages(template_data: Dict[str, Any]) -> List[Tuple[str, List[str]]]:
+    """
+    Pre-split template messages on their {{variable}} placeholders.
+    
+    Returns (role, parts) per message, where parts alternate literal text and variable names
+    (text, name, text, ..., text), so filling a message is a single join.
+    """
+    return [
+        (message.get("role", "user"), _PLACEHOLDER_RE.split(message.get("content", "")))
+        for message in template_data.get("messages", [])
+    ]
+
+
+def _fill_parts(parts: List[str], template_vars: Dict[str, str]) -> str:
+    """Join pre-split message parts, substituting variables; unknown placeholders are kept as written."""
+    return "".join([
+        part if i % 2 == 0 else template_vars.get(part, f"{{{{{part}}}}}")
+        for i, part in enumerate(parts)
+    ])
+
+
+def estimate_tokens(text: str) -> int:
+    """Count prompt tokens with tiktoken if available, otherwise estimate them from the length."""
+    global _token_encoding
+    if TIKTOKEN_SUPPORT and _token_encoding is None:
+        try:
+            _token_encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            # The encoding is downloaded on first use, which fails offline
+            logger.warning("tiktoken encoding %s unavailable, estimating tokens: %s", TOKEN_ENCODING, e)
+            _token_encoding = False
+    if _token_encoding:
+        return len(_token_encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """Estimated input tokens of a chat request (message contents only)."""
+    return sum(estimate_tokens(message["content"]) for message in messages)
+
+
+def _trim_rank_key(finding: Dict[str, Any]) -> tuple:
+    """Most severe first, then in prompt order; findings at the end are the first to be trimmed."""
+    return (_SEVERITY_RANK.get(finding.get("severity"), len(_SEVERITY_RANK)),) + _finding_sort_key(finding)
+
+
+def _finding_sort_key(finding: Dict[str, Any]) -> tuple:
+    """Most frequent first, ties broken by rule_id so equal reports always list findings alike."""
+    return -finding.get("count", 0), str(finding.get("rule_id", ""))
+
+
+def serialize_report(sast_report: Dict[str, Any], sections: Optional[List[str]] = None,
+                     fields: Optional[List[str]] = None, pretty: bool = False) -> str:
+    """
+    Serialize a SAST report for the prompt in canonical form.
+    
+    Keys are sorted and aggregated findings are put in a stable order, so identical reports
+    always produce identical prompt text (and hit provider prompt caches). Output is compact
+    unless pretty is set, since indentation only adds input tokens.
+    
+    Args:
+        sast_report: Aggregated SAST report
+        sections: Top-level keys to keep (default: all)
+        fields: Keys to keep in each aggregated finding (default: all)
+        pretty: Indent the JSON
+    """
+    if sections is not None:
+        sast_report = {key: value for key, value in sast_report.items() if key in sections}
+    
+    findings = sast_report.get("aggregated_findings")
+    if isinstance(findings, list):
+        findings = sorted(findings, key=_finding_sort_key)
+        if fields is not None:
+            findings = [{key: value for key, value in finding.items() if key in fields} for finding in findings]
+        sast_report = {**sast_report, "aggregated_findings": findings}
+    
+    if ORJSON_SUPPORT:
+        option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(sast_report, option=option).decode('utf-8')
+    if pretty:
+        return json.dumps(sast_report, ensure_ascii=False, indent=2, sort_keys=True)
+    return json.dumps(sast_report, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def _load_cache_entry(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a triage cache entry, returns None on a miss or an unreadable entry."""
+    try:
+        if ORJSON_SUPPORT:
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable triage cache entry %s: %s", cache_path, e)
+        return None
+
+
+def _store_cache_entry(cache_path: Path, data: Dict[str, Any]):
+    """Write a triage cache entry atomically, so concurrent runs never see a partial file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        if ORJSON_SUPPORT:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to write triage cache entry %s: %s", cache_path, e)
+
+
+class SemanticTriageCache:
+    """
+    Reuses a cached triage for a report whose findings are nearly the same as an earlier one.
+    
+    Consecutive scans of a project usually differ by a handful of findings. Each report is
+    fingerprinted as the set of its (rule_id, evidence location) pairs; a cached analysis is
+    reused when the Jaccard similarity of the fingerprint sets reaches the threshold. Entries
+    expire after ttl_seconds, since an old analysis drifts from the code it described.
+    
+    Entries are partitioned per (model, template). Each partition keeps an index.json of
+    compact fingerprint hashes, so a lookup reads one index file and only the best entry body.
+    """
+    
+    def __init__(self, threshold: float = 0.97, ttl_seconds: int = 7 * 24 * 3600,
+                 cache_dir: Path = TRIAGE_CACHE_DIR / "similar"):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir)
+    
+    @staticmethod
+    def fingerprints(sast_report: Dict[str, Any]) -> Set[str]:
+        """Fingerprint a report as the set of its (rule_id, evidence location) pairs."""
+        findings = sast_report.get("aggregated_findings") or []
+        # Older aggregated reports keep the findings as a dict keyed by rule_id
+        if isinstance(findings, dict):
+            findings = findings.values()
+        
+        fingerprints = set()
+        for finding in findings:
+            rule_id = finding.get("rule_id", "")
+            locations = finding.get("evidence_locations") or [f"count={finding.get('count', 0)}"]
+            fingerprints.update(f"{rule_id}|{location}" for location in locations)
+        return fingerprints
+    
+    @staticmethod
+    def _hash_fingerprints(fingerprints: Set[str]) -> Set[int]:
+        """56-bit hashes of fingerprints, compact enough to keep a whole partition in one index."""
+        return {
+            int.from_bytes(hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=7).digest(), "big")
+            for fingerprint in fingerprints
+        }
+    
+    def _partition_dir(self, model: str, template: str) -> Path:
+        """Directory holding the entries cached for one model and template."""
+        return self.cache_dir / hashlib.sha256(f"{model}|{template}".encode('utf-8')).hexdigest()[:16]
+    
+    def lookup(self, model: str, template: str,
+               sast_report: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], float, Dict[str, Any]]]:
+        """
+        Find the most similar cached analysis for the same model and template.
+        
+        Returns:
+            (analysis, similarity, delta) or None, where delta lists the rules with findings
+            added or removed since the cached report
+        """
+        partition = self._partition_dir(model, template)
+        index = _load_cache_entry(partition / "index.json")
+        if not index:
+            return None
+        
+        current = self.fingerprints(sast_report)
+        current_hashes = self._hash_fingerprints(current)
+        now = time.time()
+        expired = []
+        best = None
+        
+        for digest, meta in index.items():
+            if now - meta.get("created_at", 0) > self.ttl_seconds:
+                expired.append(digest)
+                continue
+            cached_hashes = set(meta.get("hashes", []))
+            union = len(current_hashes | cached_hashes)
+            similarity = len(current_hashes & cached_hashes) / union if union else 1.0
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (digest, similarity)
+        
+        if expired:
+            for digest in expired:
+                del index[digest]
+                (partition / f"{digest}.json").unlink(missing_ok=True)
+            _store_cache_entry(partition / "index.json", index)
+        
+        if best is None:
+            return None
+        
+        digest, similarity = best
+        entry = _load_cache_entry(partition / f"{digest}.json")
+        if entry is None:
+            return None
+        
+        cached = set(entry.get("fingerprints", []))
+        delta = {
+            "added_rules": sorted({fp.split("|", 1)[0] for fp in current - cached}),
+            "removed_rules": sorted({fp.split("|", 1)[0] for fp in cached - current}),
+            "changed_findings": len(current ^ cached)
+        }
+        return entry["analysis"], similarity, delta
+    
+    def store(self, model: str, template: str, sast_report: Dict[str, Any], analysis: Dict[str, Any]):
+        """Cache an analysis together with its report's fingerprints, and add it to the index."""
+        fingerprints = self.fingerprints(sast_report)
+        digest = hashlib.sha256("\n".join(sorted(fingerprints)).encode('utf-8')).hexdigest()
+        partition = self._partition_dir(model, template)
+        created_at = time.time()
+        _store_cache_entry(partition / f"{digest}.json", {
+            "model": model,
+            "template": template,
+            "created_at": created_at,
+            "fingerprints": sorted(fingerprints),
+            "analysis": analysis
+        })
+        
+        # Concurrent stores may drop each other's index entry; that only costs a cache miss
+        index = _load_cache_entry(partition / "index.json") or {}
+        index[digest] = {"created_at": created_at, "hashes": sorted(self._hash_fingerprints(fingerprints))}
+        _store_cache_entry(partition / "index.json", index)
+
+
 class SASTTriageAnalyzer:
-    def __init__(self, model: str = "gpt-4o-mini", template_name: str = "sast_v4"):
+    def __init__(self, model: str = "gpt-4o-mini", template_name: str = "sast_v4",
+                 max_input_tokens: Optional[int] = None):
         """
         Initialize SAST Triage Analyzer
         
         Args:
             model: LLM model to use for analysis
             template_name: Prompt template name (without .json extension)
+            max_input_tokens: Trim the least severe findings from the prompt to stay under this many tokens
         """
         self.model = model
         self.template_name = template_name
+        self.max_input_tokens = max_input_tokens
+        self._static_tokens = None
+        # Requests for one template share their static prefix; the key asks the provider to
+        # route them to the same prompt cache (bump the version when the template changes)
+        self._prompt_cache_key = hashlib.sha256(f"{template_name}|v1".encode('utf-8')).hexdigest()[:16]
         self.progress_indicator = ProgressIndicator()
-        logger.debug(f"Initialized SASTTriageAnalyzer - model: {model}, template: {template_name}")
+        logger.debug("Initialized SASTTriageAnalyzer - model: %s, template: %s", model, template_name)
         
         # Initialize LLM client
         try:
             self.llm_client = get_llm_client(model)
-            logger.info(f"Initialized LLM client: {model}")
+            logger.info("Initialized LLM client: %s", model)
         except Exception as e:
-            logger.error(f"Failed to initialize LLM client: {e}")
+            logger.error("Failed to initialize LLM client: %s", e)
             raise
         
         # Initialize prompt manager
         try:
             self.prompt_manager = PromptManager()
-            logger.info(f"Initialized prompt manager")
-            logger.debug(f"Available templates: {self.prompt_manager.list_templates()}")
+            logger.info("Initialized prompt manager")
+            # Listing templates reads the templates directory, so only do it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available templates: %s", self.prompt_manager.list_templates())
         except Exception as e:
-            logger.error(f"Failed to initialize prompt manager: {e}")
+            logger.error("Failed to initialize prompt manager: %s", e)
+            raise
+        
+        # Load the template once; its messages are pre-split on placeholders for prepare_messages
+        try:
+            self._template_data = self.prompt_manager.load_template(template_name)
+            self._message_parts = _split_template_messages(self._template_data)
+        except Exception as e:
+            logger.error("Failed to load prompt template '%s': %s", template_name, e)
             raise
     
     def load_sast_report(self, report_path: str) -> Dict[str, Any]:
         """Load SAST report from JSON file."""
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                report = json.load(f)
-            logger.info(f"Loaded SAST report: {report_path}")
+            if ORJSON_SUPPORT:
+                # Parse straight from a read-only mapping: no bytes copy of the file on the heap
+                with open(report_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                            report = orjson.loads(view)
+                    else:
+                        report = orjson.loads(b"")
+            else:
+                with open(report_path, 'r', encoding='utf-8') as f:
+                    report = json.load(f)
+            logger.info("Loaded SAST report: %s", report_path)
             return report
         except FileNotFoundError:
-            logger.error(f"SAST report file not found: {report_path}")
+            logger.error("SAST report file not found: %s", report_path)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in SAST report: {e}")
+            logger.error("Invalid JSON in SAST report: %s", e)
             raise
     
     def prepare_messages(self, sast_report: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Prepare messages for LLM using prompt template."""
+        """
+        Prepare messages for LLM using prompt template.
+        
+        Templates keep all static instructions ahead of the {{sast_report}} placeholder, so every
+        request for a template shares the same prefix and provider prompt caching can reuse it.
+        """
         try:
-            # Load template data
-            template_data = self.prompt_manager.load_template(self.template_name)
-            
             # Prepare template variables
-            template_vars = {
-                "sast_report": json.dumps(sast_report, ensure_ascii=False, indent=2)
-            }
-            
-            messages = []
+            # The template may narrow the report to what its prompt uses and ask for indentation
+            template_vars = {"sast_report": self._serialize_for_prompt(sast_report)}
             
-            # Process each message in template
-            for message in template_data.get("messages", []):
-                role = message.get("role", "user")
-                content = message.get("content", "")
-                
-                # Substitute variables in content using double curly braces {{variable}}
-                for var_name, var_value in template_vars.items():
-                    placeholder = f"{{{{{var_name}}}}}"
-                    content = content.replace(placeholder, str(var_value))
-                
-                messages.append({
-                    "role": role,
-                    "content": content
-                })
+            # Substitute variables in one join per message, without re-scanning the filled content
+            messages = [
+                {"role": role, "content": _fill_parts(parts, template_vars)}
+                for role, parts in self._message_parts
+            ]
             
-            logger.info(f"Prepared {len(messages)} messages for LLM")
+            logger.info("Prepared %d messages for LLM", len(messages))
             
-            # Debug: Show message structure
-            for i, msg in enumerate(messages):
-                role = msg["role"]
-                content_preview = msg["content"][:100].replace('\n', ' ')
-                logger.debug(f"  Message {i+1}: {role} - {content_preview}...")
+            # Debug: Show message structure (skipped entirely unless debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, msg in enumerate(messages, 1):
+                    logger.debug("  Message %d: %s - %s...", i, msg["role"], msg["content"][:100].replace('\n', ' '))
             
             return messages
             
         except Exception as e:
-            logger.error(f"Failed to prepare messages: {e}")
+            logger.error("Failed to prepare messages: %s", e)
             raise
     
-    def analyze_sast_report(self, report_path: str, output_file: Optional[str] = None) -> Dict[str, Any]:
+    def _serialize_for_prompt(self, sast_report: Dict[str, Any]) -> str:
+        """
+        Serialize the report for the prompt, trimming findings if the prompt would exceed max_input_tokens.
+        
+        Findings are dropped least severe (then least frequent) first, in steps proportional to the
+        overshoot, so a few re-serializations are enough even for large reports.
+        """
+        template_data = self._template_data
+        sections = template_data.get("report_sections")
+        fields = template_data.get("report_fields")
+        pretty = template_data.get("report_pretty", False)
+        report_text = serialize_report(sast_report, sections=sections, fields=fields, pretty=pretty)
+        
+        findings = sast_report.get("aggregated_findings")
+        if self.max_input_tokens is None or not isinstance(findings, list) or not findings:
+            return report_text
+        
+        if self._static_tokens is None:
+            self._static_tokens = sum(
+                estimate_tokens(part) for _, parts in self._message_parts for part in parts[::2]
+            )
+        budget = self.max_input_tokens - self._static_tokens
+        report_tokens = estimate_tokens(report_text)
+        if report_tokens <= budget:
+            return report_text
+        
+        ranked = sorted(findings, key=_trim_rank_key)
+        keep = len(ranked)
+        while report_tokens > budget and keep > 0:
+            keep = max(0, min(keep - 1, keep * budget // report_tokens))
+            report_text = serialize_report({**sast_report, "aggregated_findings": ranked[:keep]},
+                                           sections=sections, fields=fields, pretty=pretty)
+            report_tokens = estimate_tokens(report_text)
+        
+        dropped = ranked[keep:]
+        logger.warning("Trimmed %d of %d findings to fit max_input_tokens=%d (severity of trimmed: %s)",
+                       len(dropped), len(ranked), self.max_input_tokens,
+                       dict(Counter(f.get('severity') for f in dropped)))
+        if report_tokens > budget:
+            logger.warning("Prompt still exceeds max_input_tokens=%s without findings", self.max_input_tokens)
+        return report_text
+    
+    def _response_cache_path(self, messages: List[Dict[str, str]]) -> Optional[Path]:
+        """Cache file for this exact request, or None if the client samples too randomly to cache."""
+        temperature = getattr(self.llm_client, "temperature", None)
+        if temperature is None or temperature > MAX_CACHEABLE_TEMPERATURE:
+            logger.debug("Response cache disabled for temperature %s", temperature)
+            return None
+        
+        digest = hashlib.sha256()
+        digest.update(f"{self.model}|{self.template_name}|".encode('utf-8'))
+        digest.update(json.dumps(messages, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        return TRIAGE_CACHE_DIR / f"{digest.hexdigest()}.json"
+    
+    def _receive_stream(self, messages: List[Dict[str, str]]) -> str:
+        """Collect a streamed response, showing how much has arrived on the progress indicator."""
+        chunks = []
+        received = 0
+        for chunk in self.llm_client.chat_raw_stream(messages, prompt_cache_key=self._prompt_cache_key):
+            chunks.append(chunk)
+            received += len(chunk)
+            self.progress_indicator.update(f"Receiving {self.model} response ({received} chars)")
+        return "".join(chunks)
+    
+    def _save_analysis(self, analysis_result: Dict[str, Any], output_file: Optional[str]):
+        """Save analysis results if an output file was requested."""
+        if not output_file:
+            return
+        if ORJSON_SUPPORT:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(analysis_result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(analysis_result, f, indent=2, ensure_ascii=False)
+        logger.info("Analysis saved to: %s", output_file)
+    
+    def analyze_sast_report(self, report_path: str, output_file: Optional[str] = None,
+                            use_cache: bool = False,
+                            similar_cache: Optional[SemanticTriageCache] = None,
+                            sast_report: Optional[Dict[str, Any]] = None,
+                            stream: bool = False) -> Dict[str, Any]:
         """
         Main method to analyze SAST report using LLM.
         
         Args:
             report_path: Path to aggregated SAST report JSON
             output_file: Optional output file path for analysis results
+            use_cache: Reuse a cached response for an identical request (low-temperature clients only)
+            similar_cache: With use_cache, also reuse the analysis of a nearly identical earlier report
+            sast_report: The report already loaded from report_path, to avoid parsing it again
+            stream: Receive the response in chunks as the model produces it
             
         Returns:
             Analysis results from LLM
         """
-        logger.info(f"Starting SAST triage analysis...")
-        logger.info(f"Report: {report_path}")
-        logger.info(f"Model: {self.model}")
-        logger.info(f"Template: {self.template_name}")
-        
-        # Load SAST report
-        sast_report = self.load_sast_report(report_path)
-        
-        # Display report summary
-        summary = sast_report.get("summary", {})
-        logger.info(f"Report Summary:")
-        logger.info(f"  Total findings: {summary.get('total_findings', 'N/A')}")
-        logger.info(f"  Unique vulnerability types: {summary.get('total_unique_rules', 'N/A')}")
-        logger.info(f"  Severity distribution: {summary.get('severity_distribution', 'N/A')}")
-        
-        # Prepare messages using prompt template
-        messages = self.prepare_messages(sast_report)
+        cached_result, messages, cache_path, sast_report = self._begin_analysis(
+            report_path, output_file, use_cache, similar_cache, sast_report)
+        if cached_result is not None:
+            return cached_result
         
         # Call LLM for analysis
-        logger.info(f"Calling {self.model} for analysis...")
+        logger.info("Calling %s for analysis...", self.model)
         
         # Start progress indicator
         self.progress_indicator.start(f"Waiting for {self.model} response")
         
         try:
-            response = self.llm_client.chat_raw(messages)
+            if stream:
+                response = self._receive_stream(messages)
+            else:
+                response = self.llm_client.chat_raw(messages, prompt_cache_key=self._prompt_cache_key)
             
             # Stop progress indicator
             self.progress_indicator.stop()
-            logger.info(f"Received response from LLM")
+            logger.info("Received response from LLM")
             
-            # Try to parse as JSON if possible
-            json_content = response
-            
-            # Handle JSON wrapped in markdown code blocks
-            if response.strip().startswith("```json") and response.strip().endswith("```"):
-                json_content = response.strip()[7:-3].strip()
-                logger.debug(f"Extracted JSON from markdown code blocks")
-            elif response.strip().startswith("```") and response.strip().endswith("```"):
-                json_content = response.strip()[3:-3].strip()
-                logger.debug(f"Extracted content from code blocks")
-            
-            try:
-                analysis_result = json.loads(json_content)
-                logger.info(f"Successfully parsed JSON response")
-            except json.JSONDecodeError:
-                logger.warning(f"Response is not valid JSON, treating as text")
-                analysis_result = {
-                    "analysis_text": response,
-                    "metadata": {
-                        "model": self.model,
-                        "template": self.template_name,
-                        "source_report": report_path,
-                        "is_json": False
-                    }
-                }
-            
-            # Add metadata if JSON was successfully parsed
-            if "metadata" not in analysis_result:
-                analysis_result["metadata"] = {
-                    "model": self.model,
-                    "template": self.template_name,
-                    "source_report": report_path,
-                    "is_json": True
-                }
-            
-            # Save results if output file specified
-            if output_file:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(analysis_result, f, indent=2, ensure_ascii=False)
-                logger.info(f"Analysis saved to: {output_file}")
-            
-            return analysis_result
+            return self._finish_analysis(response, report_path, output_file, sast_report, cache_path, similar_cache,
+                                         prompt_tokens=count_message_tokens(messages))
             
         except Exception as e:
             # Make sure to stop progress indicator on error
             self.progress_indicator.stop()
-            logger.error(f"LLM analysis failed: {e}")
+            logger.error("LLM analysis failed: %s", e)
             logger.exception("Full traceback:")
             raise
     
+    async def analyze_sast_report_async(self, report_path: str, output_file: Optional[str] = None,
+                                        use_cache: bool = False,
+                                        similar_cache: Optional[SemanticTriageCache] = None,
+                                        sast_report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Async variant of analyze_sast_report, for running several triages concurrently.
+        
+        No progress indicator is shown, since concurrent analyses would share it.
+        """
+        cached_result, messages, cache_path, sast_report = self._begin_analysis(
+            report_path, output_file, use_cache, similar_cache, sast_report)
+        if cached_result is not None:
+            return cached_result
+        
+        logger.info("Calling %s for analysis of %s...", self.model, report_path)
+        try:
+            response = await self.llm_client.chat_raw_async(messages, prompt_cache_key=self._prompt_cache_key)
+            logger.info("Received response from LLM for %s", report_path)
+            return self._finish_analysis(response, report_path, output_file, sast_report, cache_path, similar_cache,
+                                         prompt_tokens=count_message_tokens(messages))
+        except Exception as e:
+            logger.error("LLM analysis failed for %s: %s", report_path, e)
+            raise
+    
+    def _begin_analysis(self, report_path: str, output_file: Optional[str], use_cache: bool,
+                        similar_cache: Optional[SemanticTriageCache],
+                        sast_report: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, str]],
+                                                                         Optional[Path], Dict[str, Any]]:
+        """
+        Load the report and prepare the LLM request.
+        
+        Returns:
+            (cached analysis or None, messages, response cache path or None, loaded report)
+        """
+        logger.info("Starting SAST triage analysis...")
+        logger.info("Report: %s", report_path)
+        logger.info("Model: %s", self.model)
+        logger.info("Template: %s", self.template_name)
+        
+        # Load SAST report unless the caller already has it
+        if sast_report is None:
+            sast_report = self.load_sast_report(report_path)
+        
+        # Display report summary
+        summary = sast_report.get("summary", {})
+        logger.info("Report Summary:")
+        logger.info("  Total findings: %s", summary.get('total_findings', 'N/A'))
+        logger.info("  Unique vulnerability types: %s", summary.get('total_unique_rules', 'N/A'))
+        logger.info("  Severity distribution: %s", summary.get('severity_distribution', 'N/A'))
+        
+        # Prepare messages using prompt template
+        messages = self.prepare_messages(sast_report)
+        
+        # Return the cached analysis of an identical request without calling the LLM
+        cache_path = self._response_cache_path(messages) if use_cache else None
+        if cache_path is not None:
+            analysis_result = _load_cache_entry(cache_path)
+            if analysis_result is not None:
+                logger.info("Using cached triage analysis: %s", cache_path)
+                analysis_result.setdefault("metadata", {})
+                analysis_result["metadata"]["source_report"] = report_path
+                analysis_result["metadata"]["cache"] = "hit"
+                self._save_analysis(analysis_result, output_file)
+                return analysis_result, messages, cache_path, sast_report
+            
+            if similar_cache is not None:
+                similar = similar_cache.lookup(self.model, self.template_name, sast_report)
+                if similar is not None:
+                    analysis_result, similarity, delta = similar
+                    logger.info("Using triage analysis of a similar report (similarity %.3f, %d findings changed)",
+                                similarity, delta['changed_findings'])
+                    analysis_result.setdefault("metadata", {})
+                    analysis_result["metadata"]["source_report"] = report_path
+                    analysis_result["metadata"]["cache"] = "similar"
+                    analysis_result["metadata"]["similarity"] = round(similarity, 4)
+                    analysis_result["metadata"]["delta"] = delta
+                    self._save_analysis(analysis_result, output_file)
+                    return analysis_result, messages, cache_path, sast_report
+        
+        return None, messages, cache_path, sast_report
+    
+    def _finish_analysis(self, response: str, report_path: str, output_file: Optional[str],
+                         sast_report: Dict[str, Any], cache_path: Optional[Path],
+                         similar_cache: Optional[SemanticTriageCache],
+                         prompt_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Parse the LLM response, cache it and save the analysis."""
+        # Try to parse as JSON if possible
+        json_content = response
+        
+        # Handle JSON wrapped in markdown code blocks (strip once, then slice)
+        stripped = response.strip()
+        if stripped.startswith("```") and stripped.endswith("```"):
+            if stripped.startswith("```json"):
+                json_content = stripped[7:-3].strip()
+                logger.debug("Extracted JSON from markdown code blocks")
+            else:
+                json_content = stripped[3:-3].strip()
+                logger.debug("Extracted content from code blocks")
+        
+        try:
+            analysis_result = json.loads(json_content)
+            logger.info("Successfully parsed JSON response")
+        except json.JSONDecodeError:
+            logger.warning("Response is not valid JSON, treating as text")
+            analysis_result = {
+                "analysis_text": response,
+                "metadata": {
+                    "model": self.model,
+                    "template": self.template_name,
+                    "source_report": report_path,
+                    "is_json": False
+                }
+            }
+        
+        # Add metadata if JSON was successfully parsed
+        if "metadata" not in analysis_result:
+            analysis_result["metadata"] = {
+                "model": self.model,
+                "template": self.template_name,
+                "source_report": report_path,
+                "is_json": True
+            }
+        
+        if prompt_tokens is not None:
+            analysis_result["metadata"]["prompt_tokens"] = prompt_tokens
+        
+        if cache_path is not None:
+            # The cache is only an optimization; failing to fill it must not fail the triage
+            try:
+                _store_cache_entry(cache_path, analysis_result)
+                if similar_cache is not None:
+                    similar_cache.store(self.model, self.template_name, sast_report, analysis_result)
+            except Exception as e:
+                logger.warning("Failed to cache triage analysis: %s", e)
+            analysis_result["metadata"]["cache"] = "miss"
+        
+        # Save results if output file specified
+        self._save_analysis(analysis_result, output_file)
+        
+        return analysis_result
+    
     def display_analysis_summary(self, analysis: Dict[str, Any]):
         """Display a summary of the analysis results."""
         print(f"\n📋 Analysis Summary:")
@@ -243,6 +702,12 @@ def run_sast_triage(**kwargs) -> Dict[str, Any]:
         model (str, optional): LLM model to use (default: 'gpt-4o-mini')
         template (str, optional): Prompt template name (default: 'sast')
         show_summary (bool, optional): Whether to display analysis summary (default: False)
+        use_cache (bool, optional): Reuse a cached response for an identical request, stored under
+            ~/.cache/cryptoslon/triage (default: False)
+        stream (bool, optional): Stream the LLM response as it is generated (default: False)
+        similarity_threshold (float, optional): With use_cache, also reuse the analysis of an earlier report
+            whose findings overlap at least this much (Jaccard, e.g. 0.97); disabled by default
+        max_input_tokens (int, optional): Trim the least severe findings to keep the prompt under this size
         log_level (str, optional): Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
         
     Returns:
@@ -287,17 +752,24 @@ def run_sast_triage(**kwargs) -> Dict[str, Any]:
     model = kwargs.get('model', 'gigachat-max')
     template = kwargs.get('template', 'sast_v4')
     show_summary = kwargs.get('show_summary', False)
+    use_cache = kwargs.get('use_cache', False)
+    similarity_threshold = kwargs.get('similarity_threshold')
+    stream = kwargs.get('stream', False)
+    max_input_tokens = kwargs.get('max_input_tokens')
 
     try:
         # Initialize analyzer
-        triage_analyzer = SASTTriageAnalyzer(model=model, template_name=template)
+        triage_analyzer = SASTTriageAnalyzer(model=model, template_name=template, max_input_tokens=max_input_tokens)
         
         # Load report to extract summary info
         sast_report = triage_analyzer.load_sast_report(input_file)
         summary = sast_report.get("summary", {})
         
         # Run analysis
-        analysis_result = triage_analyzer.analyze_sast_report(input_file, output_file)
+        similar_cache = SemanticTriageCache(threshold=similarity_threshold) if similarity_threshold else None
+        analysis_result = triage_analyzer.analyze_sast_report(input_file, output_file, use_cache=use_cache,
+                                                              similar_cache=similar_cache, sast_report=sast_report,
+                                                              stream=stream)
         
         # Display summary if requested
         if show_summary:
@@ -355,6 +827,114 @@ def run_sast_triage(**kwargs) -> Dict[str, Any]:
         }
 
 
+async def arun_sast_triage_batch(inputs: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    """
+    Async agent-friendly helper for triaging several SAST reports concurrently.
+    
+    LLM calls are network-bound, so independent reports are analyzed in parallel with
+    asyncio.gather, bounded by a semaphore; reports are loaded in a worker thread so
+    parsing a large one doesn't stall the other requests. One analyzer (and loaded
+    template) is shared. Await it from a running event loop, e.g. inside an async agent.
+    
+    Args:
+        inputs (list): One dict per report with 'input_file' (required) and 'output_file' (optional)
+        model (str, optional): LLM model to use (default: 'gigachat-max')
+        template (str, optional): Prompt template name (default: 'sast_v4')
+        concurrency (int, optional): Max LLM calls in flight (default: 4)
+        use_cache (bool, optional): Reuse a cached response for an identical request (default: False)
+        max_input_tokens (int, optional): Trim the least severe findings to keep each prompt under this size
+        log_level (str, optional): Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+        
+    Returns:
+        List of run_sast_triage-style result dicts, in the order of inputs
+    """
+    # Set logging level if provided
+    if 'log_level' in kwargs:
+        logger.setLevel(getattr(logging, kwargs['log_level'].upper(), logging.INFO))
+    
+    model = kwargs.get('model', 'gigachat-max')
+    template = kwargs.get('template', 'sast_v4')
+    concurrency = kwargs.get('concurrency', 4)
+    use_cache = kwargs.get('use_cache', False)
+    max_input_tokens = kwargs.get('max_input_tokens')
+    
+    def failure(input_file: Any, error: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "data": None,
+            "error": error,
+            "metadata": {
+                "input_file": str(input_file),
+                "model": str(model),
+                "template": str(template),
+                "show_summary": False
+            }
+        }
+    
+    try:
+        triage_analyzer = SASTTriageAnalyzer(model=model, template_name=template, max_input_tokens=max_input_tokens)
+    except Exception as e:
+        logger.exception("Exception occurred while initializing SAST triage")
+        return [failure(spec.get('input_file'), str(e)) for spec in inputs]
+    
+    async def triage_one(spec: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        input_file = spec.get('input_file')
+        output_file = spec.get('output_file')
+        if not input_file:
+            return failure(input_file, "input_file is required")
+        
+        async with semaphore:
+            try:
+                sast_report = await asyncio.to_thread(triage_analyzer.load_sast_report, input_file)
+                analysis_result = await triage_analyzer.analyze_sast_report_async(
+                    input_file, output_file, use_cache=use_cache, sast_report=sast_report)
+            except Exception as e:
+                logger.exception("Exception occurred during SAST triage of %s", input_file)
+                return failure(input_file, str(e))
+        
+        summary = sast_report.get("summary", {})
+        return {
+            "success": True,
+            "data": {
+                "analysis_result": analysis_result,
+                "is_json": analysis_result.get("metadata", {}).get("is_json", False),
+                "total_findings": summary.get("total_findings", 0),
+                "unique_rules": summary.get("total_unique_rules", 0),
+                "severity_distribution": summary.get("severity_distribution", {}),
+                "output_file": output_file if output_file else "not_saved",
+                "model_used": model,
+                "template_used": template
+            },
+            "error": None,
+            "metadata": {
+                "input_file": str(input_file),
+                "model": str(model),
+                "template": str(template),
+                "show_summary": False
+            }
+        }
+    
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = await asyncio.gather(*(triage_one(spec, semaphore) for spec in inputs), return_exceptions=True)
+    return [
+        failure(spec.get('input_file'), str(result)) if isinstance(result, BaseException) else result
+        for spec, result in zip(inputs, results)
+    ]
+
+
+def run_sast_triage_batch(inputs: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    """
+    Agent-friendly helper for triaging several SAST reports concurrently.
+    
+    Synchronous wrapper around arun_sast_triage_batch (same arguments and results);
+    it starts its own event loop, so call the async variant from code that already runs one.
+    
+    Returns:
+        List of run_sast_triage-style result dicts, in the order of inputs
+    """
+    return asyncio.run(arun_sast_triage_batch(inputs, **kwargs))
+
+
 def analyze_sast_report(
     input_file: str,
     output_file: Optional[str] = None,
@@ -394,11 +974,11 @@ def analyze_sast_report(
         if show_summary:
             triage_analyzer.display_analysis_summary(analysis_result)
         
-        logger.info(f"SAST triage analysis completed successfully!")
+        logger.info("SAST triage analysis completed successfully!")
         return analysis_result
         
     except Exception as e:
-        logger.error(f"Analysis failed: {e}")
+        logger.error("Analysis failed: %s", e)
         raise
 
 
@@ -9,23 +9,32 @@ class ProgressIndicator:
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.stop_spinner = False
         self.spinner_thread = None
+        self.message = "Processing"
 
-    def _spin(self, message: str = "Processing"):
+    def _spin(self):
         """Spinner animation function."""
         idx = 0
+        width = 0
         while not self.stop_spinner:
-            print(f'\r{self.spinner_chars[idx % len(self.spinner_chars)]} {message}...', end='', flush=True)
+            line = f'{self.spinner_chars[idx % len(self.spinner_chars)]} {self.message}...'
+            width = max(width, len(line))
+            print(f'\r{line:<{width}}', end='', flush=True)
             idx += 1
             time.sleep(0.1)
-        print('\r' + ' ' * (len(message) + 10) + '\r', end='', flush=True)  # Clear the line
+        print('\r' + ' ' * (width + 10) + '\r', end='', flush=True)  # Clear the line
 
     def start(self, message: str = "Processing"):
         """Start the spinner."""
         self.stop_spinner = False
-        self.spinner_thread = threading.Thread(target=self._spin, args=(message,))
+        self.message = message
+        self.spinner_thread = threading.Thread(target=self._spin)
         self.spinner_thread.daemon = True
         self.spinner_thread.start()
 
+    def update(self, message: str):
+        """Change the spinner message while it is running."""
+        self.message = message
+
     def stop(self):
         """Stop the spinner."""
         self.stop_spinner = True
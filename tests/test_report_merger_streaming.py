@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Example of writing a merged SAST report as NDJSON and reading it back incrementally.
+Useful for very large scans, where holding the whole merged report in memory is costly.
+The example builds two small SARIF reports itself, so it runs without a prior scan.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from SAST.report_merger import run_report_merger
+
+
+def _sarif_result(rule_id: str, uri: str, line: int) -> dict:
+    return {
+        "ruleId": rule_id,
+        "message": {"text": f"{rule_id} at line {line}"},
+        "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": uri},
+            "region": {"startLine": line, "endLine": line}
+        }}]
+    }
+
+
+def _write_sarif(path: str, results: list) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": "2.1.0", "runs": [{"results": results}]}, f)
+    return path
+
+
+def example_streaming_merge(work_dir: str):
+    """Merge semgrep and bandit SARIF reports into an NDJSON file, then count findings per category."""
+    print("🌊 Streaming Report Merge")
+    print("=" * 50)
+
+    # app.py:10 is reported by both tools, the others by one tool each
+    semgrep_file = _write_sarif(os.path.join(work_dir, "semgrep.sarif"), [
+        _sarif_result("python.lang.security.audit.eval-detected", "app.py", 10),
+        _sarif_result("python.lang.security.audit.subprocess-shell-true", "app.py", 20)
+    ])
+    bandit_file = _write_sarif(os.path.join(work_dir, "bandit.sarif"), [
+        _sarif_result("B307", "app.py", 10),
+        _sarif_result("B105", "config.py", 3)
+    ])
+
+    result = run_report_merger(
+        semgrep_file=semgrep_file,
+        bandit_file=bandit_file,
+        output_file=os.path.join(work_dir, "merged.ndjson"),
+        streaming=True  # One header line, then one finding per line
+    )
+
+    if not result["success"]:
+        print(f"❌ Merge failed: {result['error']}")
+        return None
+
+    # merged_report is an iterator over the file: the header first, then one finding per record
+    records = result["data"]["merged_report"]
+    header = next(records)
+    print(f"Total findings: {header['summary']['total_findings']}")
+
+    category_counts = {}
+    for finding in records:
+        category_counts[finding["category"]] = category_counts.get(finding["category"], 0) + 1
+
+    print("Findings read back by category:")
+    for category, count in category_counts.items():
+        print(f"  {category}: {count}")
+
+    # The header summary is patched in after all records are written, so it must agree with them
+    assert category_counts == {"both": 1, "semgrep": 1, "bandit": 1}, category_counts
+    assert header["summary"]["total_findings"] == 3
+    assert header["summary"]["both_tools"] == result["data"]["both_tools"] == 1
+    return category_counts
+
+
+def main():
+    """Run the example."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        if example_streaming_merge(work_dir) is None:
+            sys.exit(1)
+    print(f"\n✅ Streaming merge completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
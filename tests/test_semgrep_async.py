@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Example of running several semgrep scans concurrently with asyncio.
+Each scan writes semgrep's output straight to its report file; only the issue count is returned.
+
+Requires the semgrep CLI on PATH. So far this has only been run against a stand-in semgrep
+script that prints canned JSON/SARIF, not against a real semgrep installation.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from SAST.semgrep_analyzer import SemgrepAnalyzer, count_results
+
+CODE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "SAST", "code_for_sast", "taskstate")
+
+
+async def example_concurrent_formats():
+    """Produce JSON and SARIF reports for the same code in parallel."""
+    print("⚡ Concurrent Semgrep Scans")
+    print("=" * 50)
+
+    analyzer = SemgrepAnalyzer(target_path=CODE_PATH)
+
+    json_count, sarif_count = await asyncio.gather(
+        analyzer.analyze_to_file_async("semgrep_async_example.json", "json"),
+        analyzer.analyze_to_file_async("semgrep_async_example.sarif", "sarif")
+    )
+
+    # None means the scan failed or its output could not be parsed
+    print(f"JSON report: {json_count} issues")
+    print(f"SARIF report: {sarif_count} issues")
+    
+    # Each returned count must match what was actually saved to its report file
+    if json_count is not None:
+        assert count_results("semgrep_async_example.json", "json") == json_count
+    if sarif_count is not None:
+        assert count_results("semgrep_async_example.sarif", "sarif") == sarif_count
+    return json_count, sarif_count
+
+
+def main():
+    """Run the example."""
+    try:
+        json_count, sarif_count = asyncio.run(example_concurrent_formats())
+
+        if json_count is None or sarif_count is None:
+            print(f"\n❌ One of the scans failed")
+            sys.exit(1)
+        else:
+            print(f"\n✅ Both scans completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Example failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Example of using SAST triage programmatically.
 This shows how to call triage analysis with different models and settings.
 """
 
-from ..SAST.triage import analyze_sast_report, SASTTriageAnalyzer
+from ..SAST.triage import analyze_sast_report, run_sast_triage_batch, SASTTriageAnalyzer
 
 def example_basic_usage():
     """Basic usage example with default settings."""
@@ -80,6 +80,44 @@ def example_class_usage():
     
     return result
 
+def example_batch_usage():
+    """Triage several reports concurrently with one shared analyzer; a bad input fails on its own."""
+    print("\n📦 Batch SAST Triage Analysis")
+    print("=" * 50)
+    
+    inputs = [
+        {
+            "input_file": "../SAST/reports/test_1/aggregated_sast_report_semantic_v1.json",
+            "output_file": "triage_batch_example_1.json"
+        },
+        {
+            "input_file": "../SAST/reports/missing/aggregated_sast_report_semantic_v1.json",  # Deliberately absent
+            "output_file": "triage_batch_example_2.json"
+        }
+    ]
+    results = run_sast_triage_batch(
+        inputs,
+        model="gpt-4o-mini",
+        template="sast_v4",
+        concurrency=2  # At most two LLM calls in flight
+    )
+    
+    # Results come back in the order of the inputs, failures included
+    for result in results:
+        input_file = result["metadata"]["input_file"]
+        if result["success"]:
+            vulnerabilities = result["data"]["analysis_result"].get("result", [])
+            print(f"  ✅ {input_file}: {len(vulnerabilities)} vulnerabilities")
+        else:
+            print(f"  ❌ {input_file}: {result['error']}")
+    
+    # The missing report is reported as a failure without sinking the other one
+    good, bad = results
+    assert len(results) == len(inputs)
+    assert bad["success"] is False and bad["error"]
+    assert good["success"] is True, good["error"]
+    return results
+
 def main():
     """Run all examples."""
     try:
@@ -92,8 +130,11 @@ def main():
         # Example 3: Direct class usage
         result3 = example_class_usage()
         
+        # Example 4: Concurrent batch of reports
+        batch_results = example_batch_usage()
+        
         print(f"\n✅ All examples completed successfully!")
-        print(f"Generated {len([r for r in [result1, result2, result3] if r])} analysis reports.")
+        print(f"Generated {len([r for r in [result1, result2, result3] if r]) + sum(r['success'] for r in batch_results)} analysis reports.")
         
     except Exception as e:
         print(f"\n❌ Example failed: {e}")